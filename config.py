@@ -1,4 +1,5 @@
 import os
+from typing import TypedDict
 
 from dotenv import load_dotenv
 
@@ -61,6 +62,13 @@ class WebsiteConfig:
         "WUZZUF_DATE_SELECTOR",
         "div.css-1k5ee52 div.css-eg55jf, div.css-1k5ee52 div.css-1jldrig",
     )
+    # "http" fetches listing pages without a browser, falling back to it if needed
+    WUZZUF_FETCH_MODE = os.getenv("WUZZUF_FETCH_MODE", "browser").lower()
+    # Block images, fonts, media and stylesheets; false loads them on these pages and
+    # starts the shared drivers without Chrome's image/font/stylesheet switches
+    WUZZUF_BLOCK_RESOURCES = (
+        os.getenv("WUZZUF_BLOCK_RESOURCES", "True").lower() == "true"
+    )
 
     """ # NaukriGulf configuration
     NAUKRIGULF_URL = os.getenv(
@@ -150,6 +158,9 @@ class ScraperConfig:
     SCROLL_PAUSE_TIME = int(os.getenv("SCROLL_PAUSE_TIME", 2))
     JOB_DESCRIPTION_MAX_LENGTH = int(os.getenv("JOB_DESCRIPTION_MAX_LENGTH", 100))
     MIN_JOBS_PER_WEBSITE = int(os.getenv("MIN_JOBS_PER_WEBSITE", 10))
+    # Sites scraped concurrently. Each worker runs its own Chrome (several hundred
+    # MB), so keep this small to stay within the container's memory limit
+    MAX_SCRAPER_WORKERS = max(1, int(os.getenv("MAX_SCRAPER_WORKERS", 2)))
 
 
 class TelegramConfig:
@@ -192,6 +203,8 @@ WEBSITE_CONFIGS = [
         "description_selector": WebsiteConfig.WUZZUF_DESCRIPTION_SELECTOR,
         "tags_selector": WebsiteConfig.WUZZUF_TAGS_SELECTOR,
         "date_selector": WebsiteConfig.WUZZUF_DATE_SELECTOR,
+        "fetch_mode": WebsiteConfig.WUZZUF_FETCH_MODE,
+        "block_resources": WebsiteConfig.WUZZUF_BLOCK_RESOURCES,
     },
     {
         "name": "IT",
@@ -202,6 +215,8 @@ WEBSITE_CONFIGS = [
         "description_selector": WebsiteConfig.WUZZUF_DESCRIPTION_SELECTOR,
         "tags_selector": WebsiteConfig.WUZZUF_TAGS_SELECTOR,
         "date_selector": WebsiteConfig.WUZZUF_DATE_SELECTOR,
+        "fetch_mode": WebsiteConfig.WUZZUF_FETCH_MODE,
+        "block_resources": WebsiteConfig.WUZZUF_BLOCK_RESOURCES,
     },
     {
         "name": "Developer",
@@ -212,6 +227,8 @@ WEBSITE_CONFIGS = [
         "description_selector": WebsiteConfig.WUZZUF_DESCRIPTION_SELECTOR,
         "tags_selector": WebsiteConfig.WUZZUF_TAGS_SELECTOR,
         "date_selector": WebsiteConfig.WUZZUF_DATE_SELECTOR,
+        "fetch_mode": WebsiteConfig.WUZZUF_FETCH_MODE,
+        "block_resources": WebsiteConfig.WUZZUF_BLOCK_RESOURCES,
     },
     # {
     #     "name": "NaukriGulf",
@@ -245,7 +262,15 @@ WEBSITE_CONFIGS = [
     # },
 ]
 
-SCRAPER_SETTINGS = {
+
+class ScraperSettings(TypedDict):
+    job_keywords: list[str]
+    job_title_keywords: list[str]
+    posted_jobs_file: str
+    max_scraper_workers: int
+
+
+SCRAPER_SETTINGS: ScraperSettings = {
     "job_keywords": list(
         os.getenv(
             "JOB_KEYWORDS",
@@ -274,6 +299,7 @@ SCRAPER_SETTINGS = {
         ).split(",")
     ),
     "posted_jobs_file": os.getenv("POSTED_JOBS_FILE", "posted_jobs.txt"),
+    "max_scraper_workers": ScraperConfig.MAX_SCRAPER_WORKERS,
 }
 
 TELEGRAM_SETTINGS = {
@@ -3,8 +3,11 @@ import logging
 import os
 import random
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Set
 
+import telegram
+
 from config import (
     GENERAL_SETTINGS,
     LOGGER_SETTINGS,
@@ -12,9 +15,10 @@ from config import (
     TELEGRAM_SETTINGS,
     WEBSITE_CONFIGS,
 )
-from src.scrapers.scraper import scrape_jobs_from_website
-from src.utils.browser_utils import get_selenium_driver
+from src.scrapers.scraper import scrape_jobs_from_website, scrape_jobs_over_http
+from src.utils.browser_utils import driver_pool
 from src.utils.telegram_notifier import (
+    initialize_bot,
     load_posted_job_links,
     save_posted_job_links,
     send_telegram_message,
@@ -33,6 +37,30 @@ def setup_logging() -> None:
     )
 
 
+def scrape_site(website_config: Dict) -> List[Dict]:
+    """
+    Scrapes a single site, checking out a driver from the shared pool only if the
+    site needs a browser.
+    """
+    logger = logging.getLogger(__name__)
+    site_name = website_config["name"]
+    logger.info(f"Initiating scraping for {site_name}...")
+
+    try:
+        # Checking out a driver starts Chrome, so HTTP-mode sites try without one
+        jobs = scrape_jobs_over_http(website_config)
+        if not jobs:
+            with driver_pool.acquire() as driver:
+                jobs = scrape_jobs_from_website(driver, website_config, try_http=False)
+        logger.info(f"Successfully scraped {len(jobs)} jobs from {site_name}.")
+        return jobs
+    except Exception as e:
+        logger.error(f"Failed to scrape jobs from {site_name}: {e}", exc_info=True)
+        return []
+    finally:
+        time.sleep(random.uniform(5, 10))  # Delay between website scrapes
+
+
 def process_scraped_jobs(
     all_scraped_jobs: List[Dict], already_posted_links: Set[str]
 ) -> List[Dict]:
@@ -50,18 +78,40 @@ def process_scraped_jobs(
     return new_jobs
 
 
-async def notify_new_jobs(new_jobs: List[Dict], posted_jobs_file: str) -> None:
+async def send_job_messages(bot: telegram.Bot, new_jobs: List[Dict]) -> None:
     """
-    Sends new job postings to Telegram and records them.
+    Sends new job postings with one bot.
     Uses adaptive delays to avoid rate limits.
     """
     logger = logging.getLogger(__name__)
-    if TELEGRAM_SETTINGS["bot_token"] and TELEGRAM_SETTINGS["chat_id"]:
-        base_delay = 3  # Start with 3 second delay
-        for i, job in enumerate(new_jobs):
-            try:
+    base_delay = 3  # Start with 3 second delay
+    for i, job in enumerate(new_jobs):
+        try:
+            success = await send_telegram_message(
+                bot,
+                str(TELEGRAM_SETTINGS["chat_id"] or ""),
+                job,
+                bool(TELEGRAM_SETTINGS["include_date_in_message"]),
+            )
+            if success:
+                # Don't save individual links here - we'll save all at once at the end
+                pass
+
+            # Adaptive delay: increase if we're sending many messages
+            if i > 0 and i % 10 == 0:
+                base_delay = min(base_delay + 2, 10)  # Increase delay up to max 10s
+            # Pace only between messages; nothing follows the last one
+            if i < len(new_jobs) - 1:
+                await asyncio.sleep(base_delay)  # Adaptive delay between messages
+
+        except Exception as e:
+            if "RetryAfter" in str(e):
+                retry_after = int(str(e).split()[-2])  # Extract seconds from error
+                logger.info(f"Rate limit hit, waiting {retry_after} seconds...")
+                await asyncio.sleep(retry_after + 1)  # Wait the required time plus 1s
+                # Retry this message
                 success = await send_telegram_message(
-                    str(TELEGRAM_SETTINGS["bot_token"] or ""),
+                    bot,
                     str(TELEGRAM_SETTINGS["chat_id"] or ""),
                     job,
                     bool(TELEGRAM_SETTINGS["include_date_in_message"]),
@@ -69,38 +119,33 @@ async def notify_new_jobs(new_jobs: List[Dict], posted_jobs_file: str) -> None:
                 if success:
                     # Don't save individual links here - we'll save all at once at the end
                     pass
+            else:
+                logger.error(f"Error sending message for job {job.get('title')}: {e}")
 
-                # Adaptive delay: increase if we're sending many messages
-                if i > 0 and i % 10 == 0:
-                    base_delay = min(base_delay + 2, 10)  # Increase delay up to max 10s
-                await asyncio.sleep(base_delay)  # Adaptive delay between messages
 
-            except Exception as e:
-                if "RetryAfter" in str(e):
-                    retry_after = int(str(e).split()[-2])  # Extract seconds from error
-                    logger.info(f"Rate limit hit, waiting {retry_after} seconds...")
-                    await asyncio.sleep(
-                        retry_after + 1
-                    )  # Wait the required time plus 1s
-                    # Retry this message
-                    success = await send_telegram_message(
-                        str(TELEGRAM_SETTINGS["bot_token"] or ""),
-                        str(TELEGRAM_SETTINGS["chat_id"] or ""),
-                        job,
-                        bool(TELEGRAM_SETTINGS["include_date_in_message"]),
-                    )
-                    if success:
-                        # Don't save individual links here - we'll save all at once at the end
-                        pass
-                else:
-                    logger.error(
-                        f"Error sending message for job {job.get('title')}: {e}"
-                    )
+async def notify_new_jobs(new_jobs: List[Dict], posted_jobs_file: str) -> List[Dict]:
+    """
+    Sends new job postings to Telegram and records them.
+    Returns the jobs that were never sent because the bot could not start.
+    """
+    logger = logging.getLogger(__name__)
+    if TELEGRAM_SETTINGS["bot_token"] and TELEGRAM_SETTINGS["chat_id"]:
+        # One Bot per run: its HTTP client is tied to this run's event loop
+        bot = telegram.Bot(token=str(TELEGRAM_SETTINGS["bot_token"] or ""))
+        try:
+            await initialize_bot(bot)
+        except telegram.error.TelegramError as e:
+            logger.error(f"Could not start the Telegram bot; no jobs were sent: {e}")
+            return new_jobs
+        # Already initialized; leaving the block closes the bot's HTTP client
+        async with bot:
+            await send_job_messages(bot, new_jobs)
     else:
         logger.warning(
             "Telegram bot token or chat ID not configured. Skipping Telegram "
             "notifications."
         )
+    return []
 
 
 async def main() -> None:
@@ -121,27 +166,26 @@ async def main() -> None:
     logger.info(f"Loaded {len(already_posted_links)} previously posted job links.")
 
     all_scraped_jobs: List[Dict] = []
-    driver = None
     try:
         # Minimal Windows fix: pin UC driver to current Chrome major if not provided
         if os.name == "nt" and not os.environ.get("UC_CHROME_VERSION_MAIN"):
             os.environ["UC_CHROME_VERSION_MAIN"] = "138"
-        driver = get_selenium_driver()
-
-        for website_config in WEBSITE_CONFIGS:
-            site_name = website_config["name"]
-            logger.info(f"Initiating scraping for {site_name}...")
 
-            try:
-                jobs = scrape_jobs_from_website(driver, website_config)
+        max_workers = SCRAPER_SETTINGS["max_scraper_workers"]
+        logger.info(
+            f"Scraping {len(WEBSITE_CONFIGS)} sites with {max_workers} workers."
+        )
+        # Drivers are shared across sites, so start-up blocking only applies
+        # when no site opts out; each site still sets its own CDP URL blocking
+        driver_pool.configure(
+            max_drivers=max_workers,
+            block_resources=all(
+                site.get("block_resources", True) for site in WEBSITE_CONFIGS
+            ),
+        )
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for jobs in executor.map(scrape_site, WEBSITE_CONFIGS):
                 all_scraped_jobs.extend(jobs)
-                logger.info(f"Successfully scraped {len(jobs)} jobs from {site_name}.")
-            except Exception as e:
-                logger.error(
-                    f"Failed to scrape jobs from {site_name}: {e}", exc_info=True
-                )
-            finally:
-                time.sleep(random.uniform(5, 10))  # Delay between website scrapes
 
         logger.info(f"Total jobs scraped across all sites: {len(all_scraped_jobs)}")
 
@@ -151,7 +195,9 @@ async def main() -> None:
             f"Total links after processing (old + new): {len(already_posted_links)}"
         )
 
-        await notify_new_jobs(new_jobs_found, posted_jobs_file_path)
+        unsent_jobs = await notify_new_jobs(new_jobs_found, posted_jobs_file_path)
+        # Jobs the bot never got to send stay unposted, so the next run retries them
+        already_posted_links.difference_update(job["link"] for job in unsent_jobs)
         logger.info(f"About to save {len(already_posted_links)} total links to file")
         logger.info(f"File path for saving: {posted_jobs_file_path}")
         logger.info(f"Links to save: {sorted(list(already_posted_links))}")
@@ -162,9 +208,8 @@ async def main() -> None:
     except Exception as e:
         logger.critical(f"An unhandled error occurred in main: {e}", exc_info=True)
     finally:
-        if driver:
-            logger.info("Closing Selenium driver.")
-            driver.quit()
+        logger.info("Closing Selenium drivers.")
+        driver_pool.close()
         logger.info("Job scraper application finished.")
 
 
@@ -0,0 +1,151 @@
+"""
+HTTP Scraper - Browserless fetch path
+
+Fetches server-rendered listing pages over plain HTTP and parses them in-process,
+for sites configured with fetch_mode "http". Returns no jobs when the page turns
+out to need a browser, so callers can fall back to the Selenium path.
+"""
+
+import asyncio
+import logging
+import random
+
+import httpx
+from bs4 import BeautifulSoup
+
+from src.data_extractors.data_extractors import (
+    _build_card_selectors,
+    _extract_job_details_from_soup_card,
+    _parse_job_cards,
+)
+from src.scrapers.pagination import MAX_PAGES_PER_SITE, _page_url
+from src.utils.browser_utils import BLOCKING_INDICATORS_RE, USER_AGENTS
+
+logger = logging.getLogger(__name__)
+
+HTTP_TIMEOUT_SECONDS = 30
+PAGE_FETCH_CONCURRENCY = 4
+
+
+async def _fetch_listing_page(
+    client: httpx.AsyncClient, semaphore: asyncio.Semaphore, url: str
+) -> httpx.Response | None:
+    """Fetches a listing page, returning None on HTTP or network errors."""
+    async with semaphore:
+        try:
+            response = await client.get(url)
+            response.raise_for_status()
+            return response
+        except httpx.HTTPError as e:
+            logger.warning(f"HTTP fetch of {url} failed: {e}")
+            return None
+
+
+def _http_client() -> httpx.AsyncClient:
+    """Builds the client shared by every page fetch of a site."""
+    headers = {
+        "User-Agent": random.choice(USER_AGENTS),
+        "Accept-Language": "en-US,en;q=0.9",
+    }
+    return httpx.AsyncClient(
+        headers=headers, timeout=HTTP_TIMEOUT_SECONDS, follow_redirects=True
+    )
+
+
+async def _fetch_listing_pages(
+    client: httpx.AsyncClient, semaphore: asyncio.Semaphore, urls: list[str]
+) -> list[httpx.Response | None]:
+    """Fetches listing pages concurrently, in the order given."""
+    return await asyncio.gather(
+        *(_fetch_listing_page(client, semaphore, url) for url in urls)
+    )
+
+
+def _visible_page_text(html: str) -> str:
+    """Returns the text a browser would render, leaving out scripts and styles."""
+    soup = BeautifulSoup(html, "lxml")
+    body = soup.body or soup
+    for element in body(["script", "style"]):
+        element.decompose()
+    return str(body.get_text(" "))
+
+
+def _extract_jobs_from_response(response: httpx.Response, website_config: dict) -> list:
+    """Parses the job cards out of a listing page response."""
+    jobs: list = []
+    site_name = website_config["name"]
+    job_cards = _parse_job_cards(response.text, website_config["job_card_selector"])
+    selectors = _build_card_selectors(website_config)
+    base_url = str(response.url)
+    for i, card in enumerate(job_cards):
+        try:
+            job_details = _extract_job_details_from_soup_card(card, selectors, base_url)
+            if job_details:
+                jobs.append(job_details)
+        except Exception as e:
+            logger.warning(f"Error processing job card {i} on {site_name}: {e}")
+            continue
+    return jobs
+
+
+def _log_page_without_cards(
+    response: httpx.Response, site_name: str, page_index: int
+) -> None:
+    """Logs whether a page without job cards was a block or needs JavaScript."""
+    # Only pages without cards get this second, full parse. Rendered text is
+    # matched, since scripts and markup can mention "captcha" on a normal page
+    match = BLOCKING_INDICATORS_RE.search(_visible_page_text(response.text))
+    if match:
+        logger.warning(f"Blocking detected over HTTP on {site_name}: {match.group(0)}")
+    elif page_index == 0:
+        logger.info(
+            f"No job cards in the HTTP response from {site_name}; "
+            "the page likely needs JavaScript."
+        )
+
+
+async def _scrape_listing_pages(website_config: dict) -> list:
+    """
+    Fetches and parses listing pages a batch at a time, over one client so its
+    connections are reused from batch to batch.
+    """
+    jobs: list = []
+    url = website_config["url"]
+    site_name = website_config["name"]
+    max_pages = MAX_PAGES_PER_SITE if "wuzzuf.net" in url else 1
+    seen_links: set = set()
+    semaphore = asyncio.Semaphore(PAGE_FETCH_CONCURRENCY)
+
+    async with _http_client() as client:
+        for batch_start in range(0, max_pages, PAGE_FETCH_CONCURRENCY):
+            batch = range(
+                batch_start, min(batch_start + PAGE_FETCH_CONCURRENCY, max_pages)
+            )
+            responses = await _fetch_listing_pages(
+                client, semaphore, [_page_url(url, i) for i in batch]
+            )
+
+            for page_index, response in zip(batch, responses):
+                if response is None:
+                    return jobs
+                page_jobs = _extract_jobs_from_response(response, website_config)
+                if not page_jobs:
+                    _log_page_without_cards(response, site_name, page_index)
+                    return jobs
+                page_jobs = [job for job in page_jobs if job["link"] not in seen_links]
+                if not page_jobs:
+                    return jobs
+                seen_links.update(job["link"] for job in page_jobs)
+                jobs.extend(page_jobs)
+                logger.info(f"Found {len(page_jobs)} jobs on page {page_index + 1}")
+
+    logger.info(f"Found {len(jobs)} jobs on {site_name} over HTTP")
+    return jobs
+
+
+def _scrape_jobs_over_http(website_config: dict) -> list:
+    """
+    Scrapes a server-rendered listing without starting a browser. Wuzzuf listings
+    are paged by requesting `?start=N` URLs directly, a batch at a time.
+    """
+    return asyncio.run(_scrape_listing_pages(website_config))
@@ -9,17 +9,37 @@ import logging
 
 import undetected_chromedriver as uc
 
+from src.scrapers.http_scraper import _scrape_jobs_over_http
 from src.scrapers.scraping_logic import _scrape_jobs_with_retry_logic
 from src.utils.browser_utils import get_selenium_driver
 
 logger = logging.getLogger(__name__)
 
 
-def scrape_jobs_from_website(driver: uc.Chrome, website_config: dict) -> list:
+def scrape_jobs_over_http(website_config: dict) -> list:
+    """
+    Scrapes a site configured with fetch_mode "http" without starting a browser.
+    Returns no jobs for other sites, or when the page turns out to need one.
+    """
+    if website_config.get("fetch_mode") != "http":
+        return []
+    site_name = website_config["name"]
+    jobs = _scrape_jobs_over_http(website_config)
+    if jobs:
+        logger.info(f"Finished scraping {len(jobs)} jobs from {site_name}.")
+    else:
+        logger.info(f"Falling back to the browser for {site_name}.")
+    return jobs
+
+
+def scrape_jobs_from_website(
+    driver: uc.Chrome, website_config: dict, try_http: bool = True
+) -> list:
     """
     Navigates to a specified website and scrapes job postings based on its
     configuration. Utilizes WebDriverWait for robust element location,
     accounting for dynamic content loading and pagination with stealth measures.
+    Pass try_http=False when scrape_jobs_over_http has already been tried.
     """
     jobs: list = []
     url = website_config["url"]
@@ -27,6 +47,12 @@ def scrape_jobs_from_website(driver: uc.Chrome, website_config: dict) -> list:
 
     logger.info(f"Visiting {site_name} ({url}) to scrape job postings.")
 
+    # Server-rendered sites can skip the browser entirely
+    if try_http:
+        jobs = scrape_jobs_over_http(website_config)
+        if jobs:
+            return jobs
+
     jobs = _scrape_jobs_with_retry_logic(driver, website_config)
 
     logger.info(f"Finished scraping {len(jobs)} jobs from {site_name}.")
@@ -40,5 +66,6 @@ def scrape_jobs_from_website(driver: uc.Chrome, website_config: dict) -> list:
 # Re-export key functions for backward compatibility
 __all__ = [
     "scrape_jobs_from_website",
+    "scrape_jobs_over_http",
     "get_selenium_driver",
 ]
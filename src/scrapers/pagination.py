@@ -1,144 +1,185 @@
 import logging
-import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import undetected_chromedriver as uc
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
-from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
-from src.data_extractors.data_extractors import _extract_job_details_from_card
+from src.data_extractors.data_extractors import (
+    _build_card_selectors,
+    _extract_all_cards_via_js,
+)
 from src.utils.browser_utils import (
+    WAIT_POLL_FREQUENCY_SECONDS,
     detect_blocking,
-    human_like_mouse_movement,
+    human_like_hover_batch,
     random_delay,
     restart_driver_on_block,
+    set_resource_blocking,
+    wait_for_visible_elements,
 )
 
 logger = logging.getLogger(__name__)
 
 MAX_PAGES_PER_SITE = 25  # default safety limit
 
-
-def _try_css_next_button(driver: uc.Chrome) -> bool:
-    """Try to find and click next button using CSS selectors."""
-    next_page_selectors = [
-        "button.css-wq4g8g a.css-1fcv3il",  # New Wuzzuf specific next button selector
-        "button.css-zye1os a.css-1fcv3il",  # Exact Wuzzuf next button structure
-        "button.css-zye1os a",  # Button with link inside
-        "a.css-1fcv3il",  # Direct link with Wuzzuf class
-        "button[class*='css-zye1os'] a",  # Button with CSS class containing css-zye1os
-        "a[aria-label='Next']",
-        "a.next",
-        "a[rel='next']",
-        "button[aria-label='Next']",
-        ".pagination a:last-child",
-        "a[data-testid='pagination-next']",
-        "a[data-testid='next']",
-        "a[aria-label='التالي']",  # Arabic next
-        "button[aria-label='التالي']",  # Arabic next button
-        "a.css-1evf01f",  # New Wuzzuf next button selector
-        "button.css-1evf01f a",  # New Wuzzuf next button selector 2
+NEXT_PAGE_SELECTORS = [
+    "button.css-wq4g8g a.css-1fcv3il",  # New Wuzzuf specific next button selector
+    "button.css-zye1os a.css-1fcv3il",  # Exact Wuzzuf next button structure
+    "button.css-zye1os a",  # Button with link inside
+    "a.css-1fcv3il",  # Direct link with Wuzzuf class
+    "button[class*='css-zye1os'] a",  # Button with CSS class containing css-zye1os
+    "a[aria-label='Next']",
+    "a.next",
+    "a[rel='next']",
+    "button[aria-label='Next']",
+    ".pagination a:last-child",
+    "a[data-testid='pagination-next']",
+    "a[data-testid='next']",
+    "a[aria-label='التالي']",  # Arabic next
+    "button[aria-label='التالي']",  # Arabic next button
+    "a.css-1evf01f",  # New Wuzzuf next button selector
+    "button.css-1evf01f a",  # New Wuzzuf next button selector 2
+]
+
+NEXT_PAGE_LABELS = ["Next", "التالي"]
+
+# Upper bound on waiting for the previous page's cards to be replaced after a click
+PAGE_TURN_TIMEOUT_SECONDS = 5
+
+# Clicks the first enabled, visible, non-"disabled" match, trying selectors in order
+# and then falling back to links whose text reads "Next". Returns the first job card
+# as it was before the click (or true if there is none), or false if nothing matched
+_CLICK_NEXT_BUTTON_SCRIPT = """
+const [selectors, labels, cardSelector] = arguments;
+const clickable = (button) => {
+    const cls = button.getAttribute("class");
+    if (button.disabled || button.getClientRects().length === 0) return false;
+    return Boolean(cls) && !cls.toLowerCase().includes("disabled");
+};
+const candidates = [
+    ...selectors.map((selector) => document.querySelector(selector)),
+    ...Array.from(document.querySelectorAll("a")).filter((link) =>
+        labels.some((label) => link.textContent.includes(label))
+    ),
+];
+for (const button of candidates) {
+    if (button && clickable(button)) {
+        const firstCard = cardSelector ? document.querySelector(cardSelector) : null;
+        button.click();
+        return firstCard || true;
+    }
+}
+return false;
+"""
+
+
+def _page_url(url: str, page_index: int) -> str:
+    """Returns the listing URL for a zero-based page index (Wuzzuf's `start`)."""
+    if page_index == 0:
+        return url
+    parts = urlsplit(url)
+    query = [
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k != "start"
     ]
+    query.append(("start", str(page_index)))
+    return urlunsplit(parts._replace(query=urlencode(query)))
 
-    for selector in next_page_selectors:
-        try:
-            next_button = driver.find_element(By.CSS_SELECTOR, selector)
-            if next_button.is_enabled() and next_button.is_displayed():
-                class_attr = next_button.get_attribute("class")
-                if class_attr and "disabled" not in class_attr.lower():
-                    next_button.click()
-                    random_delay(3, 5)  # Increased wait for page to load after click
-                    return True
-        except NoSuchElementException:
-            continue
-    return False
-
-
-def _try_xpath_next_button(driver: uc.Chrome) -> bool:
-    """Try to find and click next button using XPath text search."""
+
+def _find_next_page_button(
+    driver: uc.Chrome, job_card_selector: str | None = None
+) -> bool:
+    """Attempts to find and click the next page button. Returns True if successful."""
+    # Selector probing, the text fallback and the click all happen in the browser,
+    # so a page turn costs one round-trip
     try:
-        next_links = driver.find_elements(
-            By.XPATH,
-            "//a[contains(text(), 'Next') or contains(text(), 'التالي')]",
+        clicked = driver.execute_script(
+            _CLICK_NEXT_BUTTON_SCRIPT,
+            NEXT_PAGE_SELECTORS,
+            NEXT_PAGE_LABELS,
+            job_card_selector,
         )
-        for link in next_links:
-            if link.is_enabled() and link.is_displayed():
-                class_attr = link.get_attribute("class")
-                if class_attr and "disabled" not in class_attr.lower():
-                    link.click()
-                    time.sleep(3)
-                    return True
-    except Exception:
-        pass
-    return False
-
-
-def _find_next_page_button(driver: uc.Chrome) -> bool:
-    """Attempts to find and click the next page button. Returns True if successful."""
-    # Try CSS selectors first
-    if _try_css_next_button(driver):
-        return True
-
-    # If CSS selectors failed, try XPath for text-based search
-    return _try_xpath_next_button(driver)
+    except WebDriverException as e:
+        logger.warning(f"Error probing next page buttons: {e}")
+        return False
+    if not clicked:
+        return False
+
+    if isinstance(clicked, WebElement):
+        # Move on as soon as the old cards are replaced instead of a fixed sleep
+        try:
+            WebDriverWait(
+                driver,
+                PAGE_TURN_TIMEOUT_SECONDS,
+                poll_frequency=WAIT_POLL_FREQUENCY_SECONDS,
+            ).until(EC.staleness_of(clicked))
+        except TimeoutException:
+            logger.debug("Previous page's job cards are still attached; continuing.")
+        random_delay(0.3, 0.7)
+    else:
+        random_delay(3, 5)  # Nothing to watch, so wait for the page to load
+    return True
 
 
 def _process_single_wuzzuf_page(
     driver: uc.Chrome, website_config: dict, page: int
-) -> tuple[list, bool]:
-    """Process a single page of Wuzzuf jobs."""
+) -> tuple[list, bool, uc.Chrome]:
+    """
+    Process a single page of Wuzzuf jobs. Returns the page's jobs, whether to keep
+    paging, and the driver to continue with, which changes if it was restarted.
+    """
     jobs: list[dict] = []
     job_card_selector = website_config["job_card_selector"]
 
-    # Check for blocking before processing
-    if detect_blocking(driver):
+    # Check for blocking before processing; page 1 was checked right after navigation
+    if page > 1 and detect_blocking(driver):
         logger.warning(f"Blocking detected on page {page}, restarting driver...")
         driver = restart_driver_on_block(driver)
-        return jobs, True  # Continue flag
-
-    # Wait for job cards to load
+        # A restarted driver comes back with the pool's default blocking
+        set_resource_blocking(driver, website_config.get("block_resources", True))
+        # The reset session is left on a blank page, so reload this listing page
+        try:
+            driver.get(_page_url(website_config["url"], page - 1))
+        except WebDriverException as e:
+            logger.warning(f"Could not reload page {page} after restart: {e}")
+            return jobs, False, driver
+        if detect_blocking(driver):
+            logger.warning(f"Page {page} is still blocked after restart; stopping")
+            return jobs, False, driver
+
+    # Wait for job cards to load; the wait returns the cards it found
     try:
-        WebDriverWait(driver, 30).until(
-            EC.visibility_of_all_elements_located((By.CSS_SELECTOR, job_card_selector))
-        )
+        job_cards = wait_for_visible_elements(driver, job_card_selector, 30)
     except TimeoutException:
         logger.warning(f"Timeout waiting for job cards on page {page}")
-        return jobs, False  # Stop flag
-
-    # Get job cards from current page
-    job_cards = driver.find_elements(By.CSS_SELECTOR, job_card_selector)
-    if not job_cards:
-        logger.warning(f"No job cards found on page {page}")
-        return jobs, False  # Stop flag
+        return jobs, False, driver  # Stop flag
 
-    # Extract jobs from current page with human-like interactions
-    page_jobs = 0
-    for i, card in enumerate(job_cards):
-        try:
-            # Simulate mouse movement to the card
-            human_like_mouse_movement(driver, card)
-
-            job_details = _extract_job_details_from_card(card, website_config)
-            if job_details:
-                jobs.append(job_details)
-                page_jobs += 1
+    # Human-like interactions over the listing, batched into one round-trip
+    try:
+        human_like_hover_batch(driver, job_cards)
+    except Exception as e:
+        logger.warning(f"Error interacting with job cards on page {page}: {e}")
 
-            # Add small delay between processing cards
-            if i % 5 == 0:  # Every 5 cards
-                random_delay(0.5, 1.0)
+    # Reading the loaded DOM makes no requests, so pause once per page, not per card
+    random_delay(0.5, 1.0)
 
-        except Exception as e:
-            logger.warning(f"Error processing job card {i} on page {page}: {e}")
-            continue
+    # Extract every card on the page in a single WebDriver round-trip
+    selectors = _build_card_selectors(website_config)
+    jobs = _extract_all_cards_via_js(driver, job_card_selector, selectors)
+    page_jobs = len(jobs)
 
     logger.info(f"Found {page_jobs} jobs on page {page}")
-    return jobs, True  # Continue flag
+    return jobs, True, driver  # Continue flag
 
 
 def _scrape_wuzzuf_pages(driver: uc.Chrome, website_config: dict) -> list:
     """Scrape all pages from Wuzzuf with pagination."""
     jobs: list[dict] = []
+    seen_links: set = set()
 
     page = 1
     # Custom limit: Wuzzuf IT should stop at 25 pages
@@ -150,16 +191,26 @@ def _scrape_wuzzuf_pages(driver: uc.Chrome, website_config: dict) -> list:
     while page <= max_pages:
         logger.info(f"Scraping page {page} from {website_config['name']}")
 
-        page_jobs, should_continue = _process_single_wuzzuf_page(
+        # Keep paging with the driver the page left us, in case it was restarted
+        page_jobs, should_continue, driver = _process_single_wuzzuf_page(
             driver, website_config, page
         )
-        jobs.extend(page_jobs)
+        # Keyed on link alone, like the posted-jobs dedupe downstream: the same
+        # posting under a reworded title is still the same job
+        new_jobs = [job for job in page_jobs if job["link"] not in seen_links]
+        seen_links.update(job["link"] for job in new_jobs)
+        jobs.extend(new_jobs)
 
         if not should_continue:
             break
+        # A page that only repeats earlier jobs means the listing is looping, so
+        # stop here rather than paging on to max_pages for nothing new
+        if page_jobs and not new_jobs:
+            logger.info(f"Page {page} only repeated earlier jobs; stopping pagination")
+            break
 
         # Try to go to next page
-        if not _find_next_page_button(driver):
+        if not _find_next_page_button(driver, website_config["job_card_selector"]):
             logger.info(f"No more pages found after page {page}")
             break
 
@@ -7,30 +7,31 @@ backward compatibility with existing code.
 
 # Import all functions from data_extractors
 from src.data_extractors.data_extractors import (
-    _attempt_link_from_card_direct,
-    _attempt_link_from_selector,
-    _attempt_link_from_title_element,
-    _extract_date,
-    _extract_description,
-    _extract_job_details_from_card,
-    _extract_link,
-    _extract_tags,
-    _extract_title,
-    _get_href_from_element,
-    parse_date_string,
+    CardSelectors,
+    _build_card_selectors,
+    _card_strainer,
+    _extract_all_cards_via_js,
+    _extract_job_details_from_soup_card,
+    _parse_job_cards,
+)
+
+# Import the browserless HTTP path
+from src.scrapers.http_scraper import (
+    _fetch_listing_page,
+    _fetch_listing_pages,
+    _scrape_jobs_over_http,
 )
 
 # Import main public interface from job_scraper
-from src.scrapers.job_scraper import scrape_jobs_from_website
+from src.scrapers.job_scraper import scrape_jobs_from_website, scrape_jobs_over_http
 
 # Import all functions from pagination
 from src.scrapers.pagination import (
     _find_next_page_button,
+    _page_url,
     _process_single_wuzzuf_page,
     _scrape_wuzzuf_pages,
     _scrape_wuzzuf_with_pagination,
-    _try_css_next_button,
-    _try_xpath_next_button,
 )
 
 # Import all functions from scraping_logic
@@ -49,36 +50,45 @@ from src.scrapers.scraping_logic import (
 # Import all functions from browser_utils
 from src.utils.browser_utils import (
     USER_AGENTS,
+    DriverPool,
     detect_blocking,
+    driver_pool,
     get_selenium_driver,
-    human_like_mouse_movement,
+    human_like_hover_batch,
     human_like_scroll,
     random_delay,
     restart_driver_on_block,
+    rotate_user_agent,
+    set_resource_blocking,
+    wait_for_visible_elements,
 )
 
+# Import date parsing
+from src.utils.date_parser import parse_date_string
+
 # Re-export all functions for backward compatibility
 __all__ = [
     # Browser utilities
     "random_delay",
     "human_like_scroll",
-    "human_like_mouse_movement",
+    "human_like_hover_batch",
     "detect_blocking",
     "get_selenium_driver",
     "restart_driver_on_block",
+    "rotate_user_agent",
+    "set_resource_blocking",
+    "wait_for_visible_elements",
     "USER_AGENTS",
+    "DriverPool",
+    "driver_pool",
     # Data extraction functions
     "parse_date_string",
-    "_extract_title",
-    "_get_href_from_element",
-    "_attempt_link_from_selector",
-    "_attempt_link_from_title_element",
-    "_attempt_link_from_card_direct",
-    "_extract_link",
-    "_extract_description",
-    "_extract_tags",
-    "_extract_date",
-    "_extract_job_details_from_card",
+    "_build_card_selectors",
+    "_extract_all_cards_via_js",
+    "CardSelectors",
+    "_parse_job_cards",
+    "_card_strainer",
+    "_extract_job_details_from_soup_card",
     # Scraping logic functions
     "_safe_driver_get",
     "_handle_scraping_retry",
@@ -90,12 +100,16 @@ __all__ = [
     "_scrape_jobs_with_retry_logic",
     "_scrape_single_page_with_scroll",
     # Pagination functions
-    "_try_css_next_button",
-    "_try_xpath_next_button",
     "_find_next_page_button",
     "_process_single_wuzzuf_page",
     "_scrape_wuzzuf_pages",
     "_scrape_wuzzuf_with_pagination",
+    # HTTP scraping functions
+    "_fetch_listing_page",
+    "_fetch_listing_pages",
+    "_page_url",
+    "_scrape_jobs_over_http",
     # Main public interface
     "scrape_jobs_from_website",
+    "scrape_jobs_over_http",
 ]
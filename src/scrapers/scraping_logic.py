@@ -2,33 +2,60 @@ import logging
 
 import undetected_chromedriver as uc
 from selenium.common.exceptions import TimeoutException, WebDriverException
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
 from tenacity import (
+    RetryCallState,
     retry,
     retry_if_exception_type,
     stop_after_attempt,
-    wait_exponential,
+    stop_after_delay,
+    wait_random,
 )
 
-from src.data_extractors.data_extractors import _extract_job_details_from_card
+from src.data_extractors.data_extractors import (
+    _build_card_selectors,
+    _extract_all_cards_via_js,
+)
 from src.scrapers.pagination import _scrape_wuzzuf_with_pagination
 from src.utils.browser_utils import (
     detect_blocking,
-    human_like_mouse_movement,
     human_like_scroll,
     random_delay,
     restart_driver_on_block,
+    rotate_user_agent,
+    set_resource_blocking,
+    wait_for_visible_elements,
 )
 
 logger = logging.getLogger(__name__)
 
 
+# A short jitter between later attempts; each attempt already pauses in
+# random_delay before navigating, and persistent blocks are backed off by the
+# outer retry loop
+_NAVIGATION_JITTER = wait_random(min=0.5, max=2.0)
+
+
+def _navigation_retry_wait(retry_state: RetryCallState) -> float:
+    """
+    Retries the first failure right away, and timeouts too, since they already
+    waited out the page load; later failures wait a short jitter first.
+    """
+    outcome = retry_state.outcome
+    if retry_state.attempt_number == 1 or (
+        outcome is not None and isinstance(outcome.exception(), TimeoutException)
+    ):
+        return 0.0
+    return float(_NAVIGATION_JITTER(retry_state))
+
+
+# Bounded by time as well as attempts, so slow failures are not retried for
+# minutes; the last error is re-raised as-is so the caller can tell blocks from
+# other failures
 @retry(
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=4, max=10),
+    stop=stop_after_attempt(3) | stop_after_delay(20),
+    wait=_navigation_retry_wait,
     retry=retry_if_exception_type((TimeoutException, WebDriverException)),
+    reraise=True,
 )
 def _safe_driver_get(driver: uc.Chrome, url: str):
     """Wrapper for driver.get() with retry logic and stealth measures."""
@@ -37,6 +64,8 @@ def _safe_driver_get(driver: uc.Chrome, url: str):
     # Add random delay before navigation
     random_delay(1.0, 3.0)
 
+    # Rotate the User-Agent per navigation instead of per driver
+    rotate_user_agent(driver)
     driver.get(url)
 
     # Check for blocking after navigation
@@ -113,25 +142,21 @@ def _handle_general_exception(
     return _handle_scraping_retry(driver, website_config, retry_count, max_retries)
 
 
-def _perform_initial_scraping_setup(driver: uc.Chrome, website_config: dict) -> bool:
+def _perform_initial_scraping_setup(driver: uc.Chrome, website_config: dict) -> None:
     """Perform initial setup for scraping including navigation and blocking check."""
     url = website_config["url"]
     site_name = website_config["name"]
     job_card_selector = website_config["job_card_selector"]
 
+    # Drivers are shared across sites, so apply this site's blocking preference
+    set_resource_blocking(driver, website_config.get("block_resources", True))
+    # Raises WebDriverException if blocking persists, which _handle_webdriver_exception
+    # answers by restarting the driver; page_source is not serialized a second time
+    # just to repeat that check
     _safe_driver_get(driver, url)
 
-    # Check for blocking after navigation
-    if detect_blocking(driver):
-        logger.warning(f"Blocking detected on {site_name}, restarting driver...")
-        driver = restart_driver_on_block(driver)
-        return False
-
-    WebDriverWait(driver, 30).until(
-        EC.visibility_of_all_elements_located((By.CSS_SELECTOR, job_card_selector))
-    )
+    wait_for_visible_elements(driver, job_card_selector, 30)
     logger.debug(f"Successfully loaded and found job cards on {site_name}.")
-    return True
 
 
 def _perform_scraping_logic(driver: uc.Chrome, website_config: dict) -> list:
@@ -155,10 +180,7 @@ def _scrape_jobs_with_retry_logic(driver: uc.Chrome, website_config: dict) -> li
 
     while retry_count < max_retries:
         try:
-            if not _perform_initial_scraping_setup(driver, website_config):
-                retry_count += 1
-                continue
-
+            _perform_initial_scraping_setup(driver, website_config)
             jobs = _perform_scraping_logic(driver, website_config)
 
             # If we got here successfully, break out of retry loop
@@ -191,7 +213,6 @@ def _scrape_jobs_with_retry_logic(driver: uc.Chrome, website_config: dict) -> li
 
 def _scrape_single_page_with_scroll(driver: uc.Chrome, website_config: dict) -> list:
     """Scrapes jobs from a single page using human-like scrolling to load more content."""
-    jobs: list = []
     site_name = website_config["name"]
     job_card_selector = website_config["job_card_selector"]
 
@@ -202,35 +223,17 @@ def _scrape_single_page_with_scroll(driver: uc.Chrome, website_config: dict) ->
     # Add random delay after scrolling
     random_delay(1.0, 2.0)
 
-    job_cards = driver.find_elements(By.CSS_SELECTOR, job_card_selector)
-    if not job_cards:
+    # Extract every card in one execute_script call; no page_source serialization
+    selectors = _build_card_selectors(website_config)
+    jobs = _extract_all_cards_via_js(driver, job_card_selector, selectors)
+    if not jobs:
         logger.warning(
             f"No job cards found using selector '{job_card_selector}' on "
             f"{site_name}. This might indicate a selector issue or no jobs."
         )
         return []
 
-    logger.info(f"Found {len(job_cards)} job cards on {site_name}")
-
-    for i, card in enumerate(job_cards):
-        # Add human-like interactions for each job card
-        try:
-            # Simulate mouse movement to the card
-            human_like_mouse_movement(driver, card)
-
-            # Extract job details
-            job_details = _extract_job_details_from_card(card, website_config)
-            if job_details:
-                jobs.append(job_details)
-
-            # Add small delay between processing cards
-            if i % 5 == 0:  # Every 5 cards
-                random_delay(0.5, 1.0)
-
-        except Exception as e:
-            logger.warning(f"Error processing job card {i} on {site_name}: {e}")
-            continue
-
+    logger.info(f"Found {len(jobs)} job cards on {site_name}")
     return jobs
 
 
@@ -1,13 +1,23 @@
 import logging
 import os
+import queue
 import random
+import re
+import threading
 import time
+from contextlib import contextmanager
+from typing import Iterator
 
 import undetected_chromedriver as uc
-from selenium.common.exceptions import NoSuchElementException, WebDriverException
-from selenium.webdriver.common.action_chains import ActionChains
+from selenium.common.exceptions import (
+    JavascriptException,
+    TimeoutException,
+    WebDriverException,
+)
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +40,192 @@ USER_AGENTS = [
     "(KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
 ]
 
+BLOCKING_INDICATORS = [
+    "403 Forbidden",
+    "Access Denied",
+    "Blocked",
+    "CAPTCHA",
+    "human verification",
+    "are you a robot",
+    "unusual traffic",
+    "verify you are human",
+]
+# One case-insensitive pass over the visible page text, without lowercasing a copy
+BLOCKING_INDICATORS_RE = re.compile(
+    "|".join(re.escape(indicator) for indicator in BLOCKING_INDICATORS),
+    re.IGNORECASE,
+)
+
+CAPTCHA_SELECTOR = ", ".join(
+    [
+        "iframe[src*='captcha']",
+        ".captcha",
+        "#captcha",
+        "[class*='captcha']",
+        "[id*='captcha']",
+    ]
+)
+
+# Replays [position, pause_ms] steps in the browser, then signals completion
+_SCROLL_STEPS_SCRIPT = """
+const steps = arguments[0];
+const done = arguments[arguments.length - 1];
+let i = 0;
+const next = () => {
+    if (i >= steps.length) {
+        done(true);
+        return;
+    }
+    const [position, pauseMs] = steps[i++];
+    window.scrollTo(0, position);
+    setTimeout(next, pauseMs);
+};
+next();
+"""
+
+# Returns the page's visible text and whether any CAPTCHA element is present
+_BLOCKING_PROBE_SCRIPT = (
+    "return [document.body ? document.body.innerText : '', "
+    "document.querySelector(arguments[0]) !== null];"
+)
+
+# URL patterns blocked at the network layer; the scraper only reads DOM text and hrefs
+BLOCKED_RESOURCE_PATTERNS = [
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.webp",
+    "*.svg",
+    "*.ico",
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*.otf",
+    "*.mp4",
+    "*.webm",
+    "*.css",
+    # Third-party analytics and ad trackers
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*connect.facebook.net*",
+    "*hotjar.com*",
+]
+
+# Command-line switches shared by every driver
+CHROME_ARGUMENTS = (
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-blink-features=AutomationControlled",
+    "--start-maximized",
+    "--window-size=1920,1080",
+    "--disable-gpu",
+    "--disable-infobars",
+    "--disable-extensions",
+    "--proxy-server='direct://'",
+    "--proxy-bypass-list=*",
+    # Chrome only honours the last --disable-features switch, so pass them once
+    "--disable-features=IsolateOrigins,site-per-process,"
+    "VizDisplayCompositor,TranslateUI",
+    "--enable-features=NetworkService,NetworkServiceInProcess",
+    "--disable-web-security",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-field-trial-config",
+    "--disable-ipc-flooding-protection",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-translate",
+    "--hide-scrollbars",
+    "--mute-audio",
+    "--no-first-run",
+    "--safebrowsing-disable-auto-update",
+    "--disable-client-side-phishing-detection",
+    "--disable-component-update",
+    "--disable-domain-reliability",
+    "--disable-print-preview",
+    "--disable-prompt-on-repost",
+    "--disable-background-networking",
+    "--disable-background-downloads",
+    "--disable-background-upload",
+    "--disable-background-media-suspend",
+    "--headless=new",
+    "--disable-reading-from-canvas",
+)
+
+# Skip image decoding and web-font downloads; the scraped fields are all text.
+# Fixed for a driver's lifetime, unlike the CDP URL patterns, so only applied
+# when every site scraped with the pool blocks resources
+RESOURCE_BLOCKING_ARGUMENTS = (
+    "--blink-settings=imagesEnabled=false",
+    "--disable-remote-fonts",
+)
+RESOURCE_BLOCKING_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.stylesheets": 2,
+    "profile.managed_default_content_settings.fonts": 2,
+}
+
+# WebDriverWait polls every 500ms by default, overshooting readiness by ~250ms
+# on average; poll closer to the in-page wait's 100ms instead
+WAIT_POLL_FREQUENCY_SECONDS = 0.15
+
+# Resolves with the matching elements once all are rendered, or null on timeout
+_WAIT_FOR_VISIBLE_SCRIPT = """
+const [selector, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+const started = Date.now();
+const check = () => {
+    const elements = Array.from(document.querySelectorAll(selector));
+    if (elements.length && elements.every((e) => e.getClientRects().length > 0)) {
+        done(elements);
+    } else if (Date.now() - started >= timeoutMs) {
+        done(null);
+    } else {
+        setTimeout(check, 100);
+    }
+};
+check();
+"""
+
+# Scrolls each element into view and dispatches hover events over a jittered
+# point inside it, replacing one ActionChains round-trip per element
+_HOVER_ELEMENTS_SCRIPT = """
+const [elements, jitter] = arguments;
+for (const element of elements) {
+    element.scrollIntoView({ behavior: "instant", block: "center" });
+    const rect = element.getBoundingClientRect();
+    const init = {
+        bubbles: true,
+        view: window,
+        clientX: rect.left + rect.width / 2 + (Math.random() * 2 - 1) * jitter,
+        clientY: rect.top + rect.height / 2 + (Math.random() * 2 - 1) * jitter,
+    };
+    for (const type of ["mouseover", "mouseenter", "mousemove"]) {
+        element.dispatchEvent(new MouseEvent(type, init));
+    }
+}
+return elements.length;
+"""
+
+# Masks the most common automation fingerprints in navigator. Each override is
+# guarded so one already-patched property does not abort the rest.
+STEALTH_JS = """
+const overrides = {
+    webdriver: () => undefined,
+    plugins: () => [1, 2, 3, 4, 5],
+    languages: () => ["en-US", "en"],
+    permissions: () => ({query: () => Promise.resolve({state: "granted"})}),
+};
+for (const [name, getter] of Object.entries(overrides)) {
+    try {
+        Object.defineProperty(navigator, name, {get: getter});
+    } catch (e) {}
+}
+"""
+
 
 def random_delay(min_seconds: float = 1.0, max_seconds: float = 3.0):
     """Add random delay to simulate human behavior."""
@@ -40,120 +236,129 @@ def random_delay(min_seconds: float = 1.0, max_seconds: float = 3.0):
 def human_like_scroll(driver: uc.Chrome, scroll_pause_time: float = 2.0):
     """Perform human-like scrolling with random patterns."""
     page_height = driver.execute_script("return document.body.scrollHeight")
+
+    # The randomized path is planned up front and replayed in one async script
+    steps = []
     current_position = 0
     while current_position < page_height:
-        scroll_distance = random.randint(300, 800)
-        current_position += scroll_distance
-        driver.execute_script(f"window.scrollTo(0, {current_position});")
-        random_delay(0.5, scroll_pause_time)
+        current_position += random.randint(300, 800)
+        steps.append(
+            (current_position, int(random.uniform(0.5, scroll_pause_time) * 1000))
+        )
         if random.random() < 0.1:
-            back_scroll = random.randint(50, 200)
-            current_position -= back_scroll
-            driver.execute_script(f"window.scrollTo(0, {current_position});")
-            random_delay(0.3, 1.0)
-
-
-def human_like_mouse_movement(driver: uc.Chrome, element: WebElement | None = None):
-    """Simulate human-like mouse movements."""
-    actions = ActionChains(driver)
-    if element:
-        actions.move_to_element_with_offset(
-            element, random.randint(-5, 5), random.randint(-5, 5)
+            current_position -= random.randint(50, 200)
+            steps.append((current_position, int(random.uniform(0.3, 1.0) * 1000)))
+
+    total_pause_seconds = sum(pause_ms for _, pause_ms in steps) / 1000
+    driver.set_script_timeout(total_pause_seconds + 10)
+    driver.execute_async_script(_SCROLL_STEPS_SCRIPT, steps)
+
+
+def wait_for_visible_elements(
+    driver: uc.Chrome, selector: str, timeout: float = 30
+) -> list[WebElement]:
+    """
+    Waits until all elements matching the CSS selector are visible and returns
+    them. Polls inside the browser, so the wait is a single WebDriver command
+    instead of a find_elements round-trip every 500ms. Raises TimeoutException
+    like WebDriverWait does.
+    """
+    try:
+        driver.set_script_timeout(timeout + 5)
+        elements = driver.execute_async_script(
+            _WAIT_FOR_VISIBLE_SCRIPT, selector, int(timeout * 1000)
+        )
+    except JavascriptException as e:
+        logger.debug(f"In-page wait failed ({e}); falling back to WebDriverWait.")
+        return list(
+            WebDriverWait(
+                driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY_SECONDS
+            ).until(EC.visibility_of_all_elements_located((By.CSS_SELECTOR, selector)))
+        )
+    if not elements:
+        raise TimeoutException(
+            f"Elements matching '{selector}' not visible after {timeout} seconds"
         )
-    else:
-        x = random.randint(100, 800)
-        y = random.randint(100, 600)
-        actions.move_by_offset(x, y)
-    actions.perform()
-    random_delay(0.1, 0.5)
+    return list(elements)
+
+
+def human_like_hover_batch(driver: uc.Chrome, elements: list[WebElement]):
+    """Simulate human-like mouse movements over many elements in one round-trip."""
+    if elements:
+        driver.execute_script(_HOVER_ELEMENTS_SCRIPT, elements, 5)
+        random_delay(0.1, 0.5)
 
 
-def detect_blocking(driver: uc.Chrome) -> bool:  # noqa: C901
+def detect_blocking(driver: uc.Chrome) -> bool:
     """Detect if the site is blocking the scraper."""
     try:
-        blocking_indicators = [
-            "403 Forbidden",
-            "Access Denied",
-            "Blocked",
-            "CAPTCHA",
-            "human verification",
-            "are you a robot",
-            "unusual traffic",
-            "verify you are human",
-        ]
-
+        # Visible text and the CAPTCHA probe come back in one round-trip, without
+        # serializing the whole page_source
+        page_text, has_captcha = driver.execute_script(
+            _BLOCKING_PROBE_SCRIPT, CAPTCHA_SELECTOR
+        )
         # Non-fatal indicators intentionally disabled to avoid unnecessary backoff/logging
-
-        page_source = driver.page_source.lower()
-        for indicator in blocking_indicators:
-            if indicator.lower() in page_source:
-                logger.warning(f"Blocking detected: {indicator}")
-                return True
+        match = BLOCKING_INDICATORS_RE.search(page_text or "")
+        if match:
+            logger.warning(f"Blocking detected: {match.group(0)}")
+            return True
         # Skipping non-fatal rate limit handling
-        captcha_selectors = [
-            "iframe[src*='captcha']",
-            ".captcha",
-            "#captcha",
-            "[class*='captcha']",
-            "[id*='captcha']",
-        ]
-        for selector in captcha_selectors:
-            try:
-                if driver.find_element(By.CSS_SELECTOR, selector):
-                    logger.warning("CAPTCHA detected")
-                    return True
-            except NoSuchElementException:
-                continue
+        if has_captcha:
+            logger.warning("CAPTCHA detected")
+            return True
         return False
     except Exception as e:
         logger.warning(f"Error detecting blocking: {e}")
         return False
 
 
-def get_selenium_driver(headers: dict | None = None):
-    """
-    Initializes and returns a configured undetected_chromedriver instance.
-    Configures browser options for headless operation, user-agent spoofing,
-    and comprehensive anti-detection measures.
-    """
+def _platform_for_user_agent(user_agent: str) -> str:
+    """Returns the navigator.platform value matching a User-Agent string."""
+    if "Windows" in user_agent:
+        return "Win32"
+    if "Macintosh" in user_agent:
+        return "MacIntel"
+    return "Linux x86_64"
+
+
+def rotate_user_agent(driver: uc.Chrome):
+    """Switches the driver to a random User-Agent via CDP, without a restart."""
+    user_agent = random.choice(USER_AGENTS)
+    try:
+        driver.execute_cdp_cmd(
+            "Network.setUserAgentOverride",
+            {
+                "userAgent": user_agent,
+                "acceptLanguage": "en-US,en;q=0.9",
+                "platform": _platform_for_user_agent(user_agent),
+            },
+        )
+    except Exception as e:
+        logger.warning(f"Could not rotate User-Agent via CDP: {e}")
+
+
+def set_resource_blocking(driver: uc.Chrome, enabled: bool = True):
+    """Blocks (or unblocks) image, font, media, stylesheet and tracker URLs via CDP."""
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd(
+            "Network.setBlockedURLs",
+            {"urls": BLOCKED_RESOURCE_PATTERNS if enabled else []},
+        )
+    except Exception as e:
+        logger.warning(f"Could not update resource blocking via CDP: {e}")
+
+
+def _build_chrome_options(block_resources: bool = True) -> uc.ChromeOptions:
+    """Builds the Chrome options shared by every driver, with a rotated User-Agent."""
     options = uc.ChromeOptions()
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-blink-features=AutomationControlled")
-    options.add_argument("--start-maximized")
-    options.add_argument("--window-size=1920,1080")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--disable-infobars")
-    options.add_argument("--disable-extensions")
-    options.add_argument("--proxy-server='direct://'")
-    options.add_argument("--proxy-bypass-list=*")
-    options.add_argument("--disable-features=IsolateOrigins,site-per-process")
-    options.add_argument("--enable-features=NetworkService,NetworkServiceInProcess")
-    options.add_argument("--disable-web-security")
-    options.add_argument("--disable-features=VizDisplayCompositor")
-    options.add_argument("--disable-background-timer-throttling")
-    options.add_argument("--disable-backgrounding-occluded-windows")
-    options.add_argument("--disable-renderer-backgrounding")
-    options.add_argument("--disable-field-trial-config")
-    options.add_argument("--disable-ipc-flooding-protection")
-    options.add_argument("--disable-default-apps")
-    options.add_argument("--disable-sync")
-    options.add_argument("--disable-translate")
-    options.add_argument("--hide-scrollbars")
-    options.add_argument("--mute-audio")
-    options.add_argument("--no-first-run")
-    options.add_argument("--safebrowsing-disable-auto-update")
-    options.add_argument("--disable-client-side-phishing-detection")
-    options.add_argument("--disable-component-update")
-    options.add_argument("--disable-domain-reliability")
-    options.add_argument("--disable-features=TranslateUI")
-    options.add_argument("--disable-print-preview")
-    options.add_argument("--disable-prompt-on-repost")
-    options.add_argument("--disable-background-networking")
-    options.add_argument("--disable-background-downloads")
-    options.add_argument("--disable-background-upload")
-    options.add_argument("--disable-background-media-suspend")
-    options.add_argument("--headless=new")
+    arguments = CHROME_ARGUMENTS + (
+        RESOURCE_BLOCKING_ARGUMENTS if block_resources else ()
+    )
+    for argument in arguments:
+        options.add_argument(argument)
+    # Return from driver.get() at DOMContentLoaded; job cards are in the initial DOM
+    options.page_load_strategy = "eager"
     user_agent = random.choice(USER_AGENTS)
     options.add_argument(f"user-agent={user_agent}")
     # Remove problematic experimental options that may be unsupported in some driver versions
@@ -164,35 +369,51 @@ def get_selenium_driver(headers: dict | None = None):
         {
             "profile.default_content_setting_values.notifications": 2,
             "profile.default_content_settings.popups": 0,
-            "profile.managed_default_content_settings.images": 2,
             "profile.default_content_setting_values.media_stream": 2,
+            **(RESOURCE_BLOCKING_PREFS if block_resources else {}),
         },
     )
+    return options
+
+
+def get_selenium_driver(
+    headers: dict | None = None,
+    worker_id: int | None = None,
+    block_resources: bool = True,
+):
+    """
+    Initializes and returns a configured undetected_chromedriver instance.
+    Configures browser options for headless operation, user-agent spoofing,
+    and comprehensive anti-detection measures. Drivers that run side by side
+    pass distinct worker ids, so each gets its own persistent profile.
+    With block_resources=False, images, stylesheets and fonts are left on.
+    """
+    options = _build_chrome_options(block_resources)
     try:
         chromedriver_path = os.environ.get("CHROMEDRIVER_PATH")
         # Minimal, explicit override for Windows/local: allow setting UC_CHROME_VERSION_MAIN
         version_main_env = os.environ.get("UC_CHROME_VERSION_MAIN")
+        # Optional persistent profile: keeps HTTP/DNS caches and cookies warm across runs
+        user_data_dir = os.environ.get("CHROME_USER_DATA_DIR")
         uc_kwargs: dict = {"options": options}
         if chromedriver_path and os.path.exists(chromedriver_path):
             uc_kwargs["driver_executable_path"] = chromedriver_path
+        if user_data_dir:
+            # Chrome locks its profile directory, so concurrent drivers cannot share one
+            if worker_id is not None:
+                user_data_dir = os.path.join(user_data_dir, f"worker-{worker_id}")
+            os.makedirs(user_data_dir, exist_ok=True)
+            uc_kwargs["user_data_dir"] = user_data_dir
         if version_main_env and version_main_env.isdigit():
             uc_kwargs["version_main"] = int(version_main_env)
 
         driver = uc.Chrome(**uc_kwargs)
-        driver.execute_script(
-            "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
-        )
-        driver.execute_script(
-            "Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]})"
-        )
-        driver.execute_script(
-            "Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']})"
-        )
-        driver.execute_script(
-            "Object.defineProperty(navigator, 'permissions', {"
-            "get: () => ({query: () => Promise.resolve({state: 'granted'})})"
-            "})"
+        # Injected into every new document before page scripts run, so the
+        # overrides survive navigations
+        driver.execute_cdp_cmd(
+            "Page.addScriptToEvaluateOnNewDocument", {"source": STEALTH_JS}
         )
+        set_resource_blocking(driver, block_resources)
         driver.set_page_load_timeout(60)
         logger.info(
             "Selenium driver successfully initialized with enhanced stealth configuration."
@@ -214,14 +435,177 @@ def get_selenium_driver(headers: dict | None = None):
         raise
 
 
+class DriverPool:
+    """
+    Bounded pool of drivers reused across sites. Drivers are created lazily up to
+    max_drivers. A blocked driver gets its session reset in place, and is only
+    quit and replaced when blocking is detected again before it is released.
+    """
+
+    def __init__(self, max_drivers: int = 1, block_resources: bool = True):
+        self.max_drivers = max_drivers
+        self.block_resources = block_resources
+        # Idle drivers, plus None for a free slot left by a driver that was dropped
+        self._idle: queue.Queue = queue.Queue()
+        self._drivers: list = []
+        self._slots = 0
+        self._block_counts: dict[uc.Chrome, int] = {}
+        # Replaced drivers map to their successor, or None if it failed to start
+        self._replacements: dict[uc.Chrome, uc.Chrome | None] = {}
+        # Worker id of each live driver, which picks its profile directory; the
+        # reserved set also covers drivers that are still starting
+        self._worker_ids: dict[uc.Chrome, int] = {}
+        self._reserved_worker_ids: set[int] = set()
+        # Guards the bookkeeping above and is only held briefly
+        self._lock = threading.Lock()
+        # uc patches a shared chromedriver binary on start-up, so creation is serialized
+        self._create_lock = threading.Lock()
+
+    def configure(self, max_drivers: int, block_resources: bool = True):
+        """
+        Sets the pool size, and whether drivers start with images, stylesheets and
+        fonts disabled. Must be called before the first driver is started.
+        """
+        with self._lock:
+            if self._slots:
+                raise RuntimeError("DriverPool is already in use; configure it first")
+            self.max_drivers = max_drivers
+            self.block_resources = block_resources
+
+    @contextmanager
+    def acquire(self) -> Iterator[uc.Chrome]:
+        """Checks out a driver for the duration of the with-block."""
+        driver = self._checkout()
+        try:
+            yield driver
+        finally:
+            self._release(driver)
+
+    def _start_driver(
+        self, headers: dict | None = None, worker_id: int | None = None
+    ) -> uc.Chrome:
+        """
+        Starts a driver for a slot the caller already holds, under the given worker
+        id (one already reserved) or the lowest free one.
+        """
+        with self._lock:
+            if worker_id is None:
+                worker_id = 0
+                while worker_id in self._reserved_worker_ids:
+                    worker_id += 1
+            self._reserved_worker_ids.add(worker_id)
+        try:
+            with self._create_lock:
+                driver = get_selenium_driver(
+                    headers, worker_id, block_resources=self.block_resources
+                )
+        except Exception:
+            with self._lock:
+                self._reserved_worker_ids.discard(worker_id)
+            raise
+        with self._lock:
+            self._drivers.append(driver)
+            self._worker_ids[driver] = worker_id
+        return driver
+
+    def _checkout(self) -> uc.Chrome:
+        try:
+            driver = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                has_free_slot = self._slots < self.max_drivers
+                if has_free_slot:
+                    self._slots += 1
+            driver = None if has_free_slot else self._idle.get()
+        if driver is not None:
+            return driver
+        try:
+            return self._start_driver()
+        except Exception:
+            self._idle.put(None)  # Leave the slot to the next checkout
+            raise
+
+    def _latest(self, driver: uc.Chrome | None) -> uc.Chrome | None:
+        while driver is not None and driver in self._replacements:
+            driver = self._replacements[driver]
+        return driver
+
+    def _release(self, driver: uc.Chrome):
+        with self._lock:
+            while driver is not None and driver in self._replacements:
+                driver = self._replacements.pop(driver)
+            self._block_counts.pop(driver, None)
+        self._idle.put(driver)  # None hands back the slot of a dropped driver
+
+    def recycle(self, driver: uc.Chrome, headers: dict | None = None) -> uc.Chrome:
+        """Resets a blocked driver's session, restarting it if blocking persists."""
+        with self._lock:
+            latest = self._latest(driver)
+            if latest is None:
+                raise WebDriverException("Blocked driver could not be restarted")
+            driver = latest
+            blocks = self._block_counts.get(driver, 0) + 1
+            self._block_counts[driver] = blocks
+            worker_id = self._worker_ids.get(driver)
+
+        if blocks < 2:
+            logger.warning("Blocking detected. Resetting driver session...")
+            try:
+                # Clears cookies for every domain, not just the current page's
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+                driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+                rotate_user_agent(driver)
+                driver.get("about:blank")
+                random_delay(2.0, 5.0)
+                return driver
+            except Exception as e:
+                logger.warning(f"Error resetting driver session: {e}")
+
+        logger.warning("Blocking persists. Restarting driver with fresh settings...")
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Error closing driver: {e}")
+        random_delay(2.0, 5.0)
+        new_driver: uc.Chrome | None = None
+        try:
+            # The successor takes over the quit driver's profile directory
+            new_driver = self._start_driver(headers, worker_id)
+        finally:
+            # Retire the quit driver; if no successor started, its slot is freed
+            # on release instead of handing the dead session back out
+            with self._lock:
+                self._drivers = [d for d in self._drivers if d is not driver]
+                self._block_counts.pop(driver, None)
+                self._worker_ids.pop(driver, None)
+                self._replacements[driver] = new_driver
+        return new_driver
+
+    def close(self):
+        """Quits every driver created by the pool."""
+        with self._lock:
+            drivers = list(self._drivers)
+            self._drivers.clear()
+            self._replacements.clear()
+            self._block_counts.clear()
+            self._worker_ids.clear()
+            self._reserved_worker_ids.clear()
+            self._slots = 0
+        while not self._idle.empty():
+            self._idle.get_nowait()
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.warning(f"Error closing driver: {e}")
+
+
+# Process-wide pool used by the scraping entry points
+driver_pool = DriverPool()
+
+
 def restart_driver_on_block(
     driver: uc.Chrome, headers: dict | None = None
 ) -> uc.Chrome:
-    """Restart the driver with fresh settings when blocking is detected."""
-    logger.warning("Blocking detected. Restarting driver with fresh settings...")
-    try:
-        driver.quit()
-    except Exception as e:
-        logger.warning(f"Error closing driver: {e}")
-    random_delay(2.0, 5.0)
-    return get_selenium_driver(headers)
+    """Reset the driver when blocking is detected, restarting it if blocking persists."""
+    return driver_pool.recycle(driver, headers)
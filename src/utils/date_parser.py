@@ -1,11 +1,60 @@
 import logging
 import re
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 from selenium.webdriver.remote.webelement import WebElement
 
 logger = logging.getLogger(__name__)
 
+# Every relative phrase, English or Arabic, fixed ("today") or counted
+# ("2 days ago", "منذ 2 يوم"), matched in a single pass
+_RELATIVE_PHRASE_RE = re.compile(
+    r"(?P<today>today)|(?P<yesterday>yesterday)|(?P<thirty>30\+\s*days?\s+ago)"
+    r"|(?P<english>(?P<count>\d+)\s+(?P<unit>minute|hour|day|week|month|year)s?\s+ago)"
+    r"|(?P<arabic>منذ\s+(?P<count_ar>\d+)\s+"
+    r"(?P<unit_ar>يوم|أيام|شهر|شهور|ساعة|ساعات|دقيقة|دقائق))"
+)
+
+# When a string holds several phrases (e.g. "yesterday" and "3 days ago"), the
+# kind listed first wins, whatever its position in the string
+_PHRASE_PRIORITY = {"today": 0, "yesterday": 1, "english": 2, "thirty": 3, "arabic": 4}
+
+_MONTH_DAY_RE = re.compile(r"([A-Za-z]{3})\s+(\d{1,2})")
+
+_MONTHS = {
+    "jan": 1,
+    "feb": 2,
+    "mar": 3,
+    "apr": 4,
+    "may": 5,
+    "jun": 6,
+    "jul": 7,
+    "aug": 8,
+    "sep": 9,
+    "oct": 10,
+    "nov": 11,
+    "dec": 12,
+}
+
+# Length of one unit of each relative date phrase
+_RELATIVE_UNITS = {
+    "minute": timedelta(minutes=1),
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+    "month": timedelta(days=30.437),
+    "year": timedelta(days=365.25),
+    "يوم": timedelta(days=1),
+    "أيام": timedelta(days=1),
+    "شهر": timedelta(days=30.437),
+    "شهور": timedelta(days=30.437),
+    "ساعة": timedelta(hours=1),
+    "ساعات": timedelta(hours=1),
+    "دقيقة": timedelta(minutes=1),
+    "دقائق": timedelta(minutes=1),
+}
+
 
 def _parse_datetime_attribute(date_element: WebElement | None) -> datetime | None:
     """Tries to parse date from a 'datetime' attribute."""
@@ -19,61 +68,49 @@ def _parse_datetime_attribute(date_element: WebElement | None) -> datetime | Non
     return None
 
 
-def _parse_relative_date(date_str_lower: str) -> datetime | None:
-    """Parses relative date strings like '2 days ago'."""
-    match_en = re.search(
-        r"(\d+)\s+(minute|hour|day|week|month|year)s?\s+ago", date_str_lower
-    )
-    if match_en:
-        value = int(match_en.group(1))
-        unit = match_en.group(2)
-        if unit == "minute":
-            return datetime.now() - timedelta(minutes=value)
-        elif unit == "hour":
-            return datetime.now() - timedelta(hours=value)
-        elif unit == "day":
-            return datetime.now() - timedelta(days=value)
-        elif unit == "week":
-            return datetime.now() - timedelta(weeks=value)
-        elif unit == "month":
-            return datetime.now() - timedelta(days=value * 30.437)
-        elif unit == "year":
-            return datetime.now() - timedelta(days=value * 365.25)
-    return None
+@lru_cache(maxsize=256)
+def _relative_phrase_offset(date_str_lower: str) -> timedelta | None:
+    """
+    Returns how long ago a relative phrase points, e.g. 2 days for '2 days ago'.
+    Offsets do not depend on the current time, so repeated phrases are cached.
+    """
+    matches = list(_RELATIVE_PHRASE_RE.finditer(date_str_lower))
+    if not matches:
+        return None
+    # min keeps the leftmost match among phrases of the same kind
+    match = min(matches, key=lambda m: _PHRASE_PRIORITY[m.lastgroup or ""])
+    kind = match.lastgroup
+    if kind == "today":
+        return timedelta()
+    if kind == "yesterday":
+        return timedelta(days=1)
+    if kind == "thirty":
+        return timedelta(days=30)
+    if kind == "english":
+        return int(match.group("count")) * _RELATIVE_UNITS[match.group("unit")]
+    return int(match.group("count_ar")) * _RELATIVE_UNITS[match.group("unit_ar")]
 
 
-def _parse_arabic_relative_date(date_str: str) -> datetime | None:
-    """Parses Arabic relative date strings like 'منذ 2 يوم'."""
-    match_ar = re.search(
-        r"منذ\s+(\d+)\s+(يوم|أيام|شهر|شهور|ساعة|ساعات|دقيقة|دقائق)", date_str
-    )
-    if match_ar:
-        value = int(match_ar.group(1))
-        unit_ar = match_ar.group(2)
-        if unit_ar in ["يوم", "أيام"]:
-            return datetime.now() - timedelta(days=value)
-        elif unit_ar in ["شهر", "شهور"]:
-            return datetime.now() - timedelta(days=value * 30.437)
-        elif unit_ar in ["ساعة", "ساعات"]:
-            return datetime.now() - timedelta(hours=value)
-        elif unit_ar in ["دقيقة", "دقائق"]:
-            return datetime.now() - timedelta(minutes=value)
-    return None
+def _parse_relative_phrase(date_str_lower: str, now: datetime) -> datetime | None:
+    """Parses 'today', 'yesterday', '30+ days ago', '2 days ago' and 'منذ 2 يوم'."""
+    offset = _relative_phrase_offset(date_str_lower)
+    if offset is None:
+        return None
+    return now - offset
 
 
-def _parse_month_day_date(date_str: str) -> datetime | None:
+def _parse_month_day_date(date_str: str, now: datetime) -> datetime | None:
     """Parses month-day formats like 'Jul 09'."""
-    month_day_match = re.search(r"([A-Za-z]{3})\s+(\d{1,2})", date_str)
+    month_day_match = _MONTH_DAY_RE.search(date_str)
     if month_day_match:
+        month = _MONTHS.get(month_day_match.group(1).lower())
+        if month is None:
+            return None
         try:
-            month_name = month_day_match.group(1)
             day = int(month_day_match.group(2))
-            current_year = datetime.now().year
-            dt_obj = datetime.strptime(f"{month_name} {day} {current_year}", "%b %d %Y")
-            if dt_obj > datetime.now():
-                dt_obj = datetime.strptime(
-                    f"{month_name} {day} {current_year - 1}", "%b %d %Y"
-                )
+            dt_obj = datetime(now.year, month, day)
+            if dt_obj > now:
+                dt_obj = datetime(now.year - 1, month, day)
             return dt_obj
         except ValueError:
             pass
@@ -87,23 +124,21 @@ def parse_date_string(
     Parses a human-readable date string or extracts from a datetime attribute.
     Tries various parsing strategies sequentially.
     """
-    date_str_lower = date_str.lower()
     now = datetime.now()
+    parsed_date = _parse_datetime_attribute(date_element)
+    if parsed_date:
+        return parsed_date
+
+    # Cards without a date carry the "Recently" placeholder; nothing to parse
+    if not date_str or date_str == "Recently":
+        return now
 
-    parsing_strategies = [
-        lambda: _parse_datetime_attribute(date_element),
-        lambda: now if "today" in date_str_lower else None,
-        lambda: now - timedelta(days=1) if "yesterday" in date_str_lower else None,
-        lambda: _parse_relative_date(date_str_lower),
-        lambda: now - timedelta(days=30) if "30+ days ago" in date_str_lower else None,
-        lambda: _parse_arabic_relative_date(date_str),
-        lambda: _parse_month_day_date(date_str),
-    ]
-
-    for strategy in parsing_strategies:
-        parsed_date = strategy()
-        if parsed_date:
-            return parsed_date
+    # Strategies are tried in order, stopping at the first one that succeeds
+    parsed_date = _parse_relative_phrase(date_str.lower(), now)
+    if parsed_date is None:
+        parsed_date = _parse_month_day_date(date_str, now)
+    if parsed_date:
+        return parsed_date
 
     logger.warning(
         f"Could not parse date string '{date_str}'. Defaulting to current time."
@@ -1,16 +1,42 @@
 import html
 import logging
-import os  # Import os for file path checks
+import re
 
 import telegram
 
 # Import tenacity
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_fixed
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_random_exponential,
+)
 
 # Set up logging for this module
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Characters html.escape rewrites; most job fields contain none of them
+_HTML_UNSAFE_RE = re.compile(r"[&<>\"']")
+
+# Telegram errors caused by a bad chat setup, which retrying cannot fix
+_CONFIG_ERROR_RE = re.compile(
+    r"chat not found|bad request: chat_id is empty|bot was blocked by the user"
+)
+
+TELEGRAM_MESSAGE_LIMIT = 4096
+TRUNCATION_NOTICE = "\n\n... (description truncated due to length limit)"
+VIEW_JOB_BUTTON_TEXT = "View Job Now!"
+
+# Everything above the description, filled in with a single format call
+_MESSAGE_HEADER_TEMPLATE = (
+    "✨ <b><u>New Job Posting - {source}</u></b> ✨\n"
+    "<b>Title:</b> {title}\n"
+    "<b>Link:</b> <a href='{link}'>View Job</a>"
+    "{date_part}{tags_part}\n"
+    "\n<b>Full Description:</b>\n"
+)
+
 
 def load_posted_job_links(file_path: str) -> set:
     """
@@ -18,22 +44,20 @@ def load_posted_job_links(file_path: str) -> set:
     Returns a set for efficient lookup.
     """
     links = set()
-    if os.path.exists(file_path):
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    links.add(line.strip())
-            logger.info(
-                f"Loaded {len(links)} previously posted job links from {file_path}"
-            )
-        except IOError as e:
-            logger.error(f"Error reading posted jobs file {file_path}: {e}")
-        except Exception as e:
-            logger.error(f"An unexpected error occurred while loading posted jobs: {e}")
-    else:
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            # One bulk read; splitlines drops the newlines, so no per-line strip
+            links = {line for line in f.read().splitlines() if line}
+        logger.info(f"Loaded {len(links)} previously posted job links from {file_path}")
+    except FileNotFoundError:
+        # Opening directly saves a separate existence check on every run
         logger.info(
             f"Posted jobs file not found: {file_path}. A new one will be created."
         )
+    except IOError as e:
+        logger.error(f"Error reading posted jobs file {file_path}: {e}")
+    except Exception as e:
+        logger.error(f"An unexpected error occurred while loading posted jobs: {e}")
     return links
 
 
@@ -59,11 +83,12 @@ def save_posted_job_links(file_path: str, links: set):
         logger.info(
             f"Attempting to save {len(links)} links to posted jobs file: {file_path}"
         )
-        logger.debug(f"Links to save: {sorted(list(links))}")
+        sorted_links = sorted(links)  # Sort for consistent file content
+        logger.debug(f"Links to save: {sorted_links}")
 
+        # One buffered write for the whole set instead of a write per link
         with open(file_path, "w", encoding="utf-8") as f:
-            for link in sorted(list(links)):  # Sort for consistent file content
-                f.write(link + "\n")
+            f.writelines(f"{link}\n" for link in sorted_links)
 
         logger.info(
             f"Successfully saved {len(links)} job links to posted jobs file: {file_path}"
@@ -74,122 +99,101 @@ def save_posted_job_links(file_path: str, links: set):
         logger.error(f"An unexpected error occurred while saving posted job links: {e}")
 
 
-def _format_telegram_message(job_post: dict, include_date: bool = False) -> str:
-    """Constructs the core message parts for a job posting."""
-    clean_title = html.escape(job_post.get("title", "No Title"))
-    clean_description = html.escape(
-        job_post.get("description", "No description available.")
-    )
-    clean_tags = ", ".join(job_post.get("tags", []))
-    if clean_tags:
-        clean_tags = html.escape(clean_tags)
-
-    message_parts = [
-        f"✨ <b><u>New Job Posting - {job_post.get('source', 'Unknown')}</u></b> ✨",
-        f"<b>Title:</b> {clean_title}",
-        f"<b>Link:</b> <a href='{job_post.get('link', '#')}'>View Job</a>",
-    ]
-
-    # Add date only if requested
-    if include_date:
-        message_parts.append(f"<b>Posted:</b> {job_post.get('posted_date', 'N/A')}")
-
-    if clean_tags:
-        message_parts.append(f"<b>Tags:</b> {clean_tags}")
+def _escape_html(text: str) -> str:
+    """
+    Escapes text for Telegram's HTML parse mode. Text without special characters
+    is returned as is, skipping html.escape's chain of replace calls.
+    """
+    if _HTML_UNSAFE_RE.search(text) is None:
+        return text
+    return html.escape(text)
 
-    message_parts.append("\n<b>Full Description:</b>")
-    message_parts.append(f"<pre>{clean_description}</pre>")
-    return "\n".join(message_parts)
 
+def _job_keyboard(link: str) -> telegram.InlineKeyboardMarkup:
+    """Builds the single-button keyboard that links to the job posting."""
+    return telegram.InlineKeyboardMarkup(
+        [[telegram.InlineKeyboardButton(text=VIEW_JOB_BUTTON_TEXT, url=link or "#")]]
+    )
 
-def _truncate_message(
-    full_message: str, job_post: dict, include_date: bool = False
-) -> str:
-    """Truncates the message if it exceeds Telegram's length limit."""
-    if len(full_message) <= 4096:
-        return full_message
 
-    # Reconstruct parts to find the description start and truncate only it
-    clean_title = html.escape(job_post.get("title", "No Title"))
+def _format_telegram_message(job_post: dict, include_date: bool = False) -> str:
+    """Constructs the message for a job posting, shortened to Telegram's limit."""
+    clean_title = _escape_html(job_post.get("title", "No Title"))
     clean_tags = ", ".join(job_post.get("tags", []))
     if clean_tags:
-        clean_tags = html.escape(clean_tags)
-
-    # Calculate length of static parts
-    static_parts_base = (
-        f"✨ <b><u>New Job Posting - {job_post.get('source', 'Unknown')}</u></b> "
-        f"✨\n<b>Title:</b> {clean_title}\n<b>Link:</b> "
-        f"<a href='{job_post.get('link', '#')}'>View Job Now!</a>"
-    )
-
-    static_parts_len = len(static_parts_base)
+        clean_tags = _escape_html(clean_tags)
 
-    # Add date length if included
+    # Optional lines collapse to empty strings when absent
+    date_part = ""
     if include_date:
-        static_parts_len += len(
-            f"\n<b>Posted:</b> {job_post.get('posted_date', 'N/A')}"
-        )
-
-    if clean_tags:
-        static_parts_len += len(f"\n<b>Tags:</b> {clean_tags}")
-    static_parts_len += len("\n\n<b>Full Description:</b>\n<pre></pre>")
-
-    max_desc_len = (
-        4096
-        - static_parts_len
-        - len("\n\n... (description truncated due to length limit)")
+        date_part = f"\n<b>Posted:</b> {job_post.get('posted_date', 'N/A')}"
+    tags_part = f"\n<b>Tags:</b> {clean_tags}" if clean_tags else ""
+
+    header = _MESSAGE_HEADER_TEMPLATE.format(
+        source=job_post.get("source", "Unknown"),
+        title=clean_title,
+        link=job_post.get("link", "#"),
+        date_part=date_part,
+        tags_part=tags_part,
     )
-
-    if max_desc_len < 50:  # Ensure a minimum description length if possible
-        max_desc_len = 50
-
-    original_description = html.escape(
+    clean_description = _escape_html(
         job_post.get("description", "No description available.")
     )
-    truncated_description = (
-        original_description[:max_desc_len]
-        + "\n\n... (description truncated due to length limit)"
-    )
+    return _truncate_message(header, clean_description)
 
-    message_parts = [
-        f"✨ <b><u>New Job Posting - {job_post.get('source', 'Unknown')}</u></b> ✨",
-        f"<b>Title:</b> {clean_title}",
-        f"<b>Link:</b> <a href='{job_post.get('link', '#')}'>View Job Now!</a>",
-    ]
 
-    # Add date only if requested
-    if include_date:
-        message_parts.append(f"<b>Posted:</b> {job_post.get('posted_date', 'N/A')}")
+def _truncate_message(header: str, clean_description: str) -> str:
+    """
+    Wraps the escaped description below the already built header, cutting only
+    the description if the message exceeds Telegram's length limit.
+    """
+    static_parts_len = len(header) + len("<pre></pre>")
+    if static_parts_len + len(clean_description) > TELEGRAM_MESSAGE_LIMIT:
+        max_desc_len = (
+            TELEGRAM_MESSAGE_LIMIT - static_parts_len - len(TRUNCATION_NOTICE)
+        )
+        if max_desc_len < 50:  # Ensure a minimum description length if possible
+            max_desc_len = 50
+        clean_description = clean_description[:max_desc_len] + TRUNCATION_NOTICE
+    return f"{header}<pre>{clean_description}</pre>"
 
-    if clean_tags:
-        message_parts.append(f"<b>Tags:</b> {clean_tags}")
-    message_parts.append("\n<b>Full Description:</b>")
-    message_parts.append(f"<pre>{truncated_description}</pre>")
 
-    return "\n".join(message_parts)
+@retry(
+    stop=stop_after_attempt(3),
+    # Same policy as send_telegram_message; the caller sees the last error itself
+    wait=wait_random_exponential(multiplier=1, max=10),
+    retry=retry_if_exception_type(telegram.error.TelegramError),
+    reraise=True,
+)
+async def initialize_bot(bot: telegram.Bot) -> None:
+    """
+    Initializes a bot before its first message. This sends one get_me request,
+    so transient network errors are retried like a send.
+    """
+    await bot.initialize()
 
 
 @retry(
     stop=stop_after_attempt(3),  # Try sending message up to 3 times
-    wait=wait_fixed(2),  # Wait 2 seconds between retries
+    # Jittered exponential backoff, so failed sends do not retry in lockstep
+    wait=wait_random_exponential(multiplier=1, max=10),
     retry=retry_if_exception_type(telegram.error.TelegramError),
 )
 async def send_telegram_message(
-    bot_token: str, chat_id: str, job_post: dict, include_date: bool = False
+    bot: telegram.Bot, chat_id: str, job_post: dict, include_date: bool = False
 ):
     """
     Sends a single job posting message to the specified Telegram chat/channel.
     Includes retry logic for network/API errors.
 
     Args:
-        bot_token: Telegram bot token
+        bot: Telegram bot, shared across the messages of a run so its HTTP
+            connection pool and TLS session are reused
         chat_id: Telegram chat ID
         job_post: Job posting dictionary
         include_date: Whether to include the posted date in the message (default: False)
     """
-    bot = telegram.Bot(token=bot_token)
-    full_message = _format_telegram_message(job_post, include_date)
-    final_message = _truncate_message(full_message, job_post, include_date)
+    final_message = _format_telegram_message(job_post, include_date)
 
     try:
         await bot.send_message(
@@ -197,15 +201,7 @@ async def send_telegram_message(
             text=final_message,
             parse_mode=telegram.constants.ParseMode.HTML,
             disable_web_page_preview=True,
-            reply_markup=telegram.InlineKeyboardMarkup(
-                [
-                    [
-                        telegram.InlineKeyboardButton(
-                            text="View Job Now!", url=job_post.get("link", "#")
-                        )
-                    ]
-                ]
-            ),
+            reply_markup=_job_keyboard(job_post.get("link", "#")),
         )
         logger.info(
             f"Telegram message sent for: {job_post['title']} "
@@ -215,7 +211,8 @@ async def send_telegram_message(
     except telegram.error.TelegramError as e:
         logger.error(f"Error sending Telegram message for {job_post['title']}: {e}")
         # Re-raise the exception to trigger tenacity retry if it's a retriable error
-        if "message is too long" in str(e).lower():
+        error_text = str(e).lower()
+        if "message is too long" in error_text:
             # This is a non-retriable error for tenacity, as retrying won't fix length.
             # Handle specifically and do not re-raise to avoid useless retries.
             logger.error(
@@ -223,11 +220,7 @@ async def send_telegram_message(
                 "Further truncation or manual review needed."
             )
             return False  # Indicate failure without retrying via tenacity
-        elif (
-            "chat not found" in str(e).lower()
-            or "bad request: chat_id is empty" in str(e).lower()
-            or "bot was blocked by the user" in str(e).lower()
-        ):
+        elif _CONFIG_ERROR_RE.search(error_text):
             logger.error(
                 "Invalid Telegram Chat ID or bot not in chat/blocked. "
                 "This is likely a configuration error, not a transient network issue."
@@ -1,217 +1,734 @@
 from datetime import datetime
-from unittest.mock import Mock
-
-from selenium.common.exceptions import NoSuchElementException
-from selenium.webdriver.common.by import By
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+from selenium.common.exceptions import (
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
 from selenium.webdriver.remote.webelement import WebElement
+from tenacity import wait_none
 
+import main
+from src.data_extractors.data_extractors import _extract_link_from_soup_card
 from src.scrapers import scraper
+from src.scrapers.http_scraper import PAGE_FETCH_CONCURRENCY
+from src.utils import date_parser
 
 parse_date_string = scraper.parse_date_string
-_extract_link = scraper._extract_link
-_extract_date = scraper._extract_date
+
+BASE_URL = "https://example.com/search"
 
 
 # --- Tests for parse_date_string ---
 
 
-def test_parse_date_string_today():
+@pytest.fixture
+def frozen_now(monkeypatch):
+    """Pins the date parser's clock so day differences cannot shift at midnight."""
+    fixed = datetime(2024, 6, 15, 12, 0, 0)
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return fixed
+
+    monkeypatch.setattr(date_parser, "datetime", FrozenDatetime)
+    return fixed
+
+
+def test_parse_date_string_today(frozen_now):
     """Test parsing 'today' date string."""
     parsed_date = parse_date_string("today")
-    assert (datetime.now().date() - parsed_date.date()).days == 0
+    assert (frozen_now.date() - parsed_date.date()).days == 0
 
 
-def test_parse_date_string_yesterday():
+def test_parse_date_string_yesterday(frozen_now):
     """Test parsing 'yesterday' date string."""
     parsed_date = parse_date_string("yesterday")
-    assert (datetime.now().date() - parsed_date.date()).days == 1
+    assert (frozen_now.date() - parsed_date.date()).days == 1
+
 
+def test_parse_date_string_30_plus_days_ago(frozen_now):
+    """Test parsing the '30+ days ago' bucket."""
+    parsed_date = parse_date_string("Posted 30+ days ago")
+    assert (frozen_now.date() - parsed_date.date()).days == 30
 
-def test_parse_date_string_relative_days_ago():
+
+def test_parse_date_string_relative_days_ago(frozen_now):
     """Test parsing 'X days ago' string."""
     parsed_date = parse_date_string("5 days ago")
-    assert (datetime.now().date() - parsed_date.date()).days == 5
+    assert (frozen_now.date() - parsed_date.date()).days == 5
 
 
-def test_parse_date_string_arabic_relative():
+def test_parse_date_string_arabic_relative(frozen_now):
     """Test parsing Arabic relative dates like 'منذ 2 يوم'."""
     parsed_date = parse_date_string("منذ 2 يوم")
-    assert (datetime.now().date() - parsed_date.date()).days == 2
+    assert (frozen_now.date() - parsed_date.date()).days == 2
+
+
+def test_parse_date_string_phrase_precedence(frozen_now):
+    """Test that mixed phrases resolve in the fixed today/yesterday/counted order."""
+    parsed_date = parse_date_string("Reposted yesterday, first posted 3 days ago")
+    assert (frozen_now.date() - parsed_date.date()).days == 1
+    parsed_date = parse_date_string("30+ days ago, updated 2 days ago")
+    assert (frozen_now.date() - parsed_date.date()).days == 2
+    # Priority does not depend on where a phrase sits in the string
+    parsed_date = parse_date_string("First posted 3 days ago, reposted yesterday")
+    assert (frozen_now.date() - parsed_date.date()).days == 1
+
 
+def test_parse_date_string_month_day(frozen_now):
+    """Test parsing 'Mon DD' dates, which never resolve to the future."""
+    parsed_date = parse_date_string("Jul 09")
+    assert (parsed_date.month, parsed_date.day) == (7, 9)
+    assert parsed_date == datetime(2023, 7, 9)
 
-def test_parse_date_string_future_date():
+
+def test_parse_date_string_future_date(frozen_now):
     """Test parsing a future date string (should be today)."""
     parsed_date = parse_date_string("1 day from now")
-    assert parsed_date.date() == datetime.now().date()
+    assert parsed_date == frozen_now
 
 
-def test_parse_date_string_unparseable():
+def test_parse_date_string_unparseable(frozen_now):
     """Test behavior for an unparseable date string (should default to today's date)."""
     parsed_date = parse_date_string("some random date string")
-    assert parsed_date.date() == datetime.now().date()
+    assert parsed_date == frozen_now
 
 
-# --- Tests for _extract_link ---
+def test_parse_date_string_caches_relative_offsets(frozen_now):
+    """Test that repeated phrases reuse the cached offset."""
+    date_parser._relative_phrase_offset.cache_clear()
+    first = parse_date_string("3 days ago")
+    second = parse_date_string("3 days ago")
+    assert date_parser._relative_phrase_offset.cache_info().hits == 1
+    assert first == second == datetime(2024, 6, 12, 12, 0, 0)
 
 
-def test_extract_link_from_link_selector():
-    """Test extracting link using the primary link selector."""
-    mock_card = Mock(spec=WebElement)
-    mock_link_element = Mock(spec=WebElement)
-    mock_link_element.get_attribute.return_value = "http://example.com/job1"
-    mock_card.find_element.return_value = mock_link_element
+def test_parse_date_string_recently_placeholder(frozen_now, caplog):
+    """Test that the "Recently" placeholder maps to now without a parse warning."""
+    parsed_date = parse_date_string("Recently")
+    assert parsed_date == frozen_now
+    assert "Could not parse" not in caplog.text
 
-    mock_title_element = Mock(spec=WebElement)
-    mock_title_element.tag_name = "div"
-    mock_title_element.get_attribute.return_value = None
-    mock_title_element.find_element.side_effect = NoSuchElementException
 
-    link = _extract_link(mock_card, mock_title_element, "a.job-link", "Test Site")
-    assert link == "http://example.com/job1"
-    mock_card.find_element.assert_called_once_with(By.CSS_SELECTOR, "a.job-link")
-    mock_title_element.get_attribute.assert_not_called()
-    mock_title_element.find_element.assert_not_called()
-    mock_card.get_attribute.assert_not_called()
+# --- Tests for page_source snapshot extraction ---
 
 
-def test_extract_link_from_title_element():
-    """Test extracting link from title element as a fallback (title_element is <a>)."""
-    mock_card = Mock(spec=WebElement)
-    mock_title_element = Mock(spec=WebElement)
-    mock_title_element.tag_name = "a"
-    mock_title_element.get_attribute.return_value = "http://example.com/job2"
+def test_extract_job_details_from_soup_card():
+    """Test extracting all card fields from a parsed page_source snapshot."""
+    page_source = """
+    <div class="card">
+      <h2><a href="/jobs/p/123">Cloud Engineer</a></h2>
+      <div class="desc">Full Time <span class="tag">AWS</span>
+        <span class="tag">Terraform</span><span class="tag"> </span></div>
+    </div>
+    <div class="card"><h2><span>No link here</span></h2></div>
+    """
+    cards = scraper._parse_job_cards(page_source, "div.card")
+    selectors = scraper.CardSelectors(
+        "Test Site", "h2", "h2 a", "div.desc", "span.tag", ".date"
+    )
 
-    mock_card.find_element.side_effect = NoSuchElementException(
-        "Mock: Primary link selector not found"
+    job = scraper._extract_job_details_from_soup_card(
+        cards[0], selectors, "https://example.com/search"
+    )
+    assert job == {
+        "title": "Cloud Engineer",
+        "link": "https://example.com/jobs/p/123",
+        "description": "Full Time AWS Terraform",
+        "source": "Test Site",
+        "tags": ["AWS", "Terraform"],
+        "posted_date": "Recently",
+    }
+    assert (
+        scraper._extract_job_details_from_soup_card(
+            cards[1], selectors, "https://example.com/search"
+        )
+        is None
     )
 
-    link = _extract_link(mock_card, mock_title_element, "a.job-link", "Test Site")
-    assert link == "http://example.com/job2"
-    mock_card.find_element.assert_called_once_with(By.CSS_SELECTOR, "a.job-link")
-    mock_title_element.get_attribute.assert_called_once_with("href")
-    mock_title_element.find_element.assert_not_called()
-    mock_card.get_attribute.assert_not_called()
 
+def _soup_card(html: str, card_selector: str = "div.card"):
+    """Parses a single card the way the HTTP and snapshot paths do."""
+    return scraper._parse_job_cards(html, card_selector)[0]
 
-def test_extract_link_from_title_element_nested_link():
-    """Test extracting link from a nested <a> tag within the title element."""
-    mock_card = Mock(spec=WebElement)
-    mock_title_element = Mock(spec=WebElement)
-    mock_title_element.tag_name = "div"
 
-    mock_nested_link = Mock(spec=WebElement)
-    mock_nested_link.get_attribute.return_value = "http://example.com/job_nested"
-    mock_title_element.find_element.return_value = mock_nested_link
+def test_extract_link_from_soup_card_title_is_link():
+    """Test falling back to the title element when it is itself an <a>."""
+    card = _soup_card('<div class="card"><a class="t" href="/jobs/2">Dev</a></div>')
+    link = _extract_link_from_soup_card(
+        card, card.select_one("a.t"), "a.job-link", BASE_URL
+    )
+    assert link == "https://example.com/jobs/2"
+
 
-    mock_card.find_element.side_effect = NoSuchElementException(
-        "Mock: Primary link selector not found"
+def test_extract_link_from_soup_card_nested_title_link():
+    """Test falling back to an <a> nested inside the title element."""
+    card = _soup_card('<div class="card"><h2><a href="/jobs/n">Dev</a></h2></div>')
+    link = _extract_link_from_soup_card(
+        card, card.select_one("h2"), "a.job-link", BASE_URL
     )
+    assert link == "https://example.com/jobs/n"
 
-    link = _extract_link(mock_card, mock_title_element, "a.job-link", "Test Site")
-    assert link == "http://example.com/job_nested"
-    mock_card.find_element.assert_called_once_with(By.CSS_SELECTOR, "a.job-link")
-    mock_title_element.get_attribute.assert_not_called()
-    mock_title_element.find_element.assert_called_once_with(By.TAG_NAME, "a")
-    mock_nested_link.get_attribute.assert_called_once_with("href")
-    mock_card.get_attribute.assert_not_called()
 
+def test_extract_link_from_soup_card_card_is_link():
+    """Test falling back to the card itself when it is the link element."""
+    card = _soup_card('<a class="card" href="/jobs/3"><span>Dev</span></a>', "a.card")
+    link = _extract_link_from_soup_card(
+        card, card.select_one("span"), "a.job-link", BASE_URL
+    )
+    assert link == "https://example.com/jobs/3"
 
-def test_extract_link_from_card_itself():
-    """Test extracting link when the card itself is the link element."""
-    mock_card = Mock(spec=WebElement)
-    mock_card.tag_name = "a"
-    mock_card.get_attribute.return_value = "http://example.com/job3"
 
-    mock_card.find_element.side_effect = NoSuchElementException(
-        "Mock: Link selector fails"
+def test_extract_link_from_soup_card_all_fallbacks_fail():
+    """Test that an empty string is returned when no fallback has a link."""
+    card = _soup_card('<div class="card"><p>Dev</p><a>No href</a></div>')
+    link = _extract_link_from_soup_card(
+        card, card.select_one("p"), "a.job-link", BASE_URL
     )
+    assert link == ""
 
-    mock_title_element = Mock(spec=WebElement)
-    mock_title_element.tag_name = "span"
-    mock_title_element.get_attribute.return_value = None
-    mock_title_element.find_element.side_effect = NoSuchElementException(
-        "Mock: No nested link in title"
+
+@pytest.mark.parametrize(
+    "date_text",
+    [
+        "Posted 1 day ago",
+        "Posted 7 days ago",
+        "Posted yesterday",
+        "Posted 2 hours ago",
+        "Posted 3 weeks ago",
+    ],
+)
+def test_extract_soup_card_date_various_formats(date_text):
+    """Test that the date text is kept as is, for parse_date_string to read later."""
+    card = _soup_card(
+        f'<div class="card"><h2><a href="/j">Dev</a></h2>'
+        f'<span class="date">{date_text}</span></div>'
     )
+    selectors = scraper.CardSelectors("Test Site", "h2", None, None, None, ".date")
+    job = scraper._extract_job_details_from_soup_card(card, selectors, BASE_URL)
+    assert job["posted_date"] == date_text
+
+
+def test_extract_soup_card_date_not_found():
+    """Test that a card without a date element defaults to 'Recently'."""
+    card = _soup_card('<div class="card"><h2><a href="/j">Dev</a></h2></div>')
+    selectors = scraper.CardSelectors("Test Site", "h2", None, None, None, ".date")
+    job = scraper._extract_job_details_from_soup_card(card, selectors, BASE_URL)
+    assert job["posted_date"] == "Recently"
+
+
+def test_parse_job_cards_strains_to_card_subtrees():
+    """Test that simple card selectors only build the matching subtrees."""
+    assert scraper._card_strainer("div.card.featured") is not None
+    assert scraper._card_strainer("div.list > div.card") is None
+
+    page_source = """
+    <html><head><script>var cards = 1;</script></head><body>
+      <nav class="card-nav">Menu</nav>
+      <div class="card featured"><h2>One</h2></div>
+      <div class="card"><h2>Two</h2></div>
+    </body></html>
+    """
+    cards = scraper._parse_job_cards(page_source, "div.card.featured")
+    assert [card.get_text(strip=True) for card in cards] == ["One"]
+    cards = scraper._parse_job_cards(page_source, "body > div.card")
+    assert [card.get_text(strip=True) for card in cards] == ["One", "Two"]
+
+
+def test_extract_all_cards_via_js():
+    """Test that one execute_script result is mapped to job dicts."""
+    mock_driver = Mock()
+    mock_driver.execute_script.return_value = [
+        {
+            "title": "SRE",
+            "link": "https://example.com/jobs/1",
+            "description": None,
+            "tags": ["Linux"],
+            "date": None,
+        },
+        {"title": "No Link", "link": "", "description": "", "tags": [], "date": ""},
+    ]
+    selectors = scraper.CardSelectors("Test Site", "h2", None, ".d", ".t", ".date")
+
+    jobs = scraper._extract_all_cards_via_js(mock_driver, "div.card", selectors)
+    assert jobs == [
+        {
+            "title": "SRE",
+            "link": "https://example.com/jobs/1",
+            "description": "",
+            "source": "Test Site",
+            "tags": ["Linux"],
+            "posted_date": "Recently",
+        }
+    ]
+    mock_driver.execute_script.assert_called_once()
+
+
+# --- Tests for DriverPool ---
+
+
+@patch("src.utils.browser_utils.random_delay")
+@patch("src.utils.browser_utils.get_selenium_driver")
+def test_driver_pool_reuses_and_recycles_drivers(mock_get_driver, _mock_delay):
+    """Test that drivers are reused, reset in place, and only replaced on repeat blocks."""
+    first_driver, second_driver = Mock(), Mock()
+    mock_get_driver.side_effect = [first_driver, second_driver]
+    pool = scraper.DriverPool(max_drivers=1)
+
+    with pool.acquire() as driver:
+        assert driver is first_driver
+        assert pool.recycle(driver) is first_driver
+        first_driver.execute_cdp_cmd.assert_any_call("Network.clearBrowserCookies", {})
+        first_driver.quit.assert_not_called()
+        assert pool.recycle(driver) is second_driver
+        first_driver.quit.assert_called_once()
+
+    with pool.acquire() as driver:
+        assert driver is second_driver
+    assert mock_get_driver.call_count == 2
+
+    pool.close()
+    second_driver.quit.assert_called_once()
+
+
+@patch("src.utils.browser_utils.random_delay")
+@patch("src.utils.browser_utils.get_selenium_driver")
+def test_driver_pool_drops_driver_that_cannot_be_replaced(mock_get_driver, _mock_delay):
+    """Test that a quit driver is not handed out again when its restart fails."""
+    first_driver, third_driver = Mock(), Mock()
+    pool = scraper.DriverPool(max_drivers=1)
+
+    def start_driver(headers=None, worker_id=None, block_resources=True):
+        # Starting Chrome must not stall other workers waiting on the pool
+        assert not pool._lock.locked()
+        return next(drivers)
+
+    drivers = iter([first_driver])
+    mock_get_driver.side_effect = start_driver
+    with pool.acquire() as driver:
+        pool.recycle(driver)
+        mock_get_driver.side_effect = WebDriverException("Chrome failed to start")
+        with pytest.raises(WebDriverException):
+            pool.recycle(driver)
+        first_driver.quit.assert_called_once()
+
+    drivers = iter([third_driver])
+    mock_get_driver.side_effect = start_driver
+    with pool.acquire() as driver:
+        assert driver is third_driver
+
+
+@patch("src.utils.browser_utils.random_delay")
+@patch("src.utils.browser_utils.get_selenium_driver")
+def test_driver_pool_gives_each_driver_its_own_worker_id(mock_get_driver, _mock_delay):
+    """Test that concurrent drivers get distinct profiles and restarts keep theirs."""
+    first_driver, second_driver, third_driver = Mock(), Mock(), Mock()
+    mock_get_driver.side_effect = [first_driver, second_driver, third_driver]
+    pool = scraper.DriverPool(max_drivers=2)
+
+    with pool.acquire(), pool.acquire() as driver_b:
+        pool.recycle(driver_b)
+        assert pool.recycle(driver_b) is third_driver
+
+    assert [call.args for call in mock_get_driver.call_args_list] == [
+        (None, 0),
+        (None, 1),
+        (None, 1),
+    ]
 
-    link = _extract_link(mock_card, mock_title_element, "a.job-link", "Test Site")
-    assert link == "http://example.com/job3"
-    mock_card.find_element.assert_called_once_with(By.CSS_SELECTOR, "a.job-link")
-    mock_title_element.get_attribute.assert_not_called()
-    mock_title_element.find_element.assert_called_once_with(By.TAG_NAME, "a")
-    mock_card.get_attribute.assert_called_once_with("href")
 
+@patch("src.utils.browser_utils.uc.Chrome")
+def test_get_selenium_driver_uses_worker_profile_directory(
+    mock_chrome, tmp_path, monkeypatch
+):
+    """Test that a worker id selects a subdirectory of the shared profile path."""
+    monkeypatch.setenv("CHROME_USER_DATA_DIR", str(tmp_path))
 
-def test_extract_link_not_found_all_fallbacks_fail():
-    """Test when no link can be found through any fallback."""
-    mock_card = Mock(spec=WebElement)
-    mock_card.find_element.side_effect = NoSuchElementException(
-        "Mock: Link selector fails"
-    )
+    scraper.get_selenium_driver(worker_id=1)
 
-    mock_title_element = Mock(spec=WebElement)
-    mock_title_element.tag_name = "p"
-    mock_title_element.get_attribute.return_value = None
-    mock_title_element.find_element.side_effect = NoSuchElementException(
-        "Mock: No nested link in title"
-    )
+    user_data_dir = mock_chrome.call_args.kwargs["user_data_dir"]
+    assert user_data_dir == str(tmp_path / "worker-1")
+    assert (tmp_path / "worker-1").is_dir()
 
-    mock_card.tag_name = "div"
 
-    link = _extract_link(mock_card, mock_title_element, "a.job-link", "Test Site")
-    assert link == ""
+@patch("src.utils.browser_utils.uc.Chrome")
+def test_get_selenium_driver_can_leave_resources_on(mock_chrome):
+    """Test that block_resources=False drops the start-up image and font blocking."""
+    driver = scraper.get_selenium_driver(block_resources=False)
 
-    mock_card.find_element.assert_called_once_with(By.CSS_SELECTOR, "a.job-link")
-    mock_title_element.get_attribute.assert_not_called()
-    mock_title_element.find_element.assert_called_once_with(By.TAG_NAME, "a")
-    mock_card.get_attribute.assert_not_called()
+    options = mock_chrome.call_args.kwargs["options"]
+    assert "--blink-settings=imagesEnabled=false" not in options.arguments
+    assert "--disable-remote-fonts" not in options.arguments
+    prefs = options.experimental_options["prefs"]
+    assert "profile.managed_default_content_settings.stylesheets" not in prefs
+    driver.execute_cdp_cmd.assert_any_call("Network.setBlockedURLs", {"urls": []})
 
 
-# --- Tests for _extract_date ---
+# --- Tests for the HTTP scraping path ---
 
 
-def test_extract_date_found():
-    """Test extracting date when the element is found."""
-    mock_card = Mock(spec=WebElement)
-    mock_date_element = Mock(spec=WebElement)
-    mock_date_element.text = "Posted 6 days ago"
-    mock_card.find_element.return_value = mock_date_element
+@patch("src.scrapers.http_scraper._visible_page_text")
+@patch("src.scrapers.http_scraper._fetch_listing_pages", new_callable=AsyncMock)
+def test_scrape_jobs_over_http(mock_fetch, mock_visible_text):
+    """Test that a server-rendered listing is scraped without a browser."""
+    url = "https://example.com/search?q=devops"
+    mock_fetch.return_value = [
+        httpx.Response(
+            200,
+            text='<div class="card"><h2><a href="/jobs/9">SRE</a></h2></div>',
+            request=httpx.Request("GET", url),
+        )
+    ]
+    website_config = {
+        "name": "Test Site",
+        "url": url,
+        "job_card_selector": "div.card",
+        "title_selector": "h2",
+    }
+
+    jobs = scraper._scrape_jobs_over_http(website_config)
+    assert [(job["title"], job["link"]) for job in jobs] == [
+        ("SRE", "https://example.com/jobs/9")
+    ]
+    mock_fetch.assert_awaited_once()
+    assert mock_fetch.await_args.args[2] == [url]
+    # Pages with cards are not parsed a second time for blocking text
+    mock_visible_text.assert_not_called()
+
+
+@patch("src.scrapers.http_scraper._fetch_listing_pages", new_callable=AsyncMock)
+def test_scrape_jobs_over_http_reuses_client_across_batches(mock_fetch):
+    """Test that every batch of Wuzzuf pages is fetched with the same client."""
+    url = "https://wuzzuf.net/search/jobs/?q=it"
+    request = httpx.Request("GET", url)
+    first_batch = [
+        httpx.Response(
+            200,
+            text=f'<div class="card"><h2><a href="/jobs/{i}">Job {i}</a></h2></div>',
+            request=request,
+        )
+        for i in range(PAGE_FETCH_CONCURRENCY)
+    ]
+    mock_fetch.side_effect = [first_batch, [None] * PAGE_FETCH_CONCURRENCY]
+    website_config = {
+        "name": "Wuzzuf Test",
+        "url": url,
+        "job_card_selector": "div.card",
+        "title_selector": "h2",
+    }
+
+    jobs = scraper._scrape_jobs_over_http(website_config)
+
+    assert len(jobs) == PAGE_FETCH_CONCURRENCY
+    first_call, second_call = mock_fetch.await_args_list
+    assert first_call.args[0] is second_call.args[0]
+
+
+@patch("src.scrapers.http_scraper._fetch_listing_pages", new_callable=AsyncMock)
+def test_scrape_jobs_over_http_reports_blocked_page(mock_fetch, caplog):
+    """Test that a page without cards is checked for blocking text."""
+    url = "https://example.com/search?q=devops"
+    mock_fetch.return_value = [
+        httpx.Response(
+            200,
+            text="<html><body><h1>Access Denied</h1></body></html>",
+            request=httpx.Request("GET", url),
+        )
+    ]
+    website_config = {
+        "name": "Test Site",
+        "url": url,
+        "job_card_selector": "div.card",
+        "title_selector": "h2",
+    }
 
-    date = _extract_date(mock_card, ".date", "Test Site")
-    assert date == "Posted 6 days ago"
-    mock_card.find_element.assert_called_once_with(By.CSS_SELECTOR, ".date")
+    assert scraper._scrape_jobs_over_http(website_config) == []
+    assert "Blocking detected over HTTP on Test Site: Access Denied" in caplog.text
 
 
-def test_extract_date_various_formats():
-    """Test extracting date with various relative date formats."""
-    test_cases = [
-        "Posted 1 day ago",
-        "Posted 7 days ago",
-        "Posted 9 days ago",
-        "Posted yesterday",
-        "Posted 2 hours ago",
-        "Posted 30 minutes ago",
-        "Posted 3 weeks ago",
-        "Posted 1 month ago",
+def test_page_url_sets_start_index():
+    """Test that paginated URLs replace any existing start parameter."""
+    url = "https://wuzzuf.net/search/jobs/?q=it&start=3"
+    assert scraper._page_url(url, 0) == url
+    assert scraper._page_url(url, 2) == "https://wuzzuf.net/search/jobs/?q=it&start=2"
+
+
+def test_page_url_keeps_blank_parameters():
+    """Test that empty query parameters survive when the start index is set."""
+    url = "https://wuzzuf.net/search/jobs/?a=&q=it"
+    assert (
+        scraper._page_url(url, 1) == "https://wuzzuf.net/search/jobs/?a=&q=it&start=1"
+    )
+
+
+@patch("src.scrapers.http_scraper._fetch_listing_pages", new_callable=AsyncMock)
+def test_scrape_jobs_over_http_ignores_indicators_in_scripts(mock_fetch):
+    """Test that blocking words in scripts or markup do not stop an HTTP scrape."""
+    url = "https://example.com/search?q=devops"
+    html = (
+        "<html><head><style>.captcha { display: none; }</style></head><body>"
+        '<script>window.captchaKey = "CAPTCHA";</script>'
+        '<div class="card" data-x="Blocked"><h2><a href="/jobs/9">SRE</a></h2></div>'
+        "</body></html>"
+    )
+    mock_fetch.return_value = [
+        httpx.Response(200, text=html, request=httpx.Request("GET", url))
     ]
+    website_config = {
+        "name": "Test Site",
+        "url": url,
+        "job_card_selector": "div.card",
+        "title_selector": "h2",
+    }
+
+    jobs = scraper._scrape_jobs_over_http(website_config)
+    assert [job["title"] for job in jobs] == ["SRE"]
 
-    for date_text in test_cases:
-        mock_card = Mock(spec=WebElement)
-        mock_date_element = Mock(spec=WebElement)
-        mock_date_element.text = date_text
-        mock_card.find_element.return_value = mock_date_element
 
-        date = _extract_date(mock_card, ".date", "Test Site")
-        assert date == date_text
-        mock_card.find_element.assert_called_with(By.CSS_SELECTOR, ".date")
+@patch("main.time.sleep")
+@patch("src.utils.browser_utils.get_selenium_driver")
+@patch("src.scrapers.job_scraper._scrape_jobs_over_http")
+def test_scrape_site_skips_the_browser_for_http_sites(
+    mock_http, mock_get_driver, _mock_sleep
+):
+    """Test that an HTTP-mode site that yields jobs never starts Chrome."""
+    job = {"title": "SRE", "link": "https://example.com/jobs/9"}
+    mock_http.return_value = [job]
+    website_config = {
+        "name": "Test Site",
+        "url": "https://example.com/search",
+        "fetch_mode": "http",
+    }
 
+    assert main.scrape_site(website_config) == [job]
+    mock_get_driver.assert_not_called()
+
+
+@patch("main.time.sleep")
+@patch("main.scrape_jobs_from_website", return_value=[])
+@patch("main.driver_pool")
+@patch("src.scrapers.job_scraper._scrape_jobs_over_http", return_value=[])
+def test_scrape_site_falls_back_to_a_pooled_driver(
+    mock_http, mock_pool, mock_scrape, _mock_sleep
+):
+    """Test that an HTTP-mode site without cards is scraped once with a driver."""
+    website_config = {
+        "name": "Test Site",
+        "url": "https://example.com/search",
+        "fetch_mode": "http",
+    }
+
+    main.scrape_site(website_config)
+
+    mock_http.assert_called_once_with(website_config)
+    driver = mock_pool.acquire.return_value.__enter__.return_value
+    mock_scrape.assert_called_once_with(driver, website_config, try_http=False)
+
+
+# --- Tests for detect_blocking ---
+
+
+def test_detect_blocking_matches_indicator_case_insensitively():
+    """Test that blocking indicators are matched regardless of case."""
+    mock_driver = Mock()
+    mock_driver.execute_script.return_value = ["ACCESS DENIED", False]
+
+    assert scraper.detect_blocking(mock_driver) is True
+    mock_driver.execute_script.assert_called_once()
+
+
+def test_detect_blocking_checks_text_and_captcha_in_one_call():
+    """Test that visible text and all CAPTCHA selectors are probed in one call."""
+    mock_driver = Mock()
+    mock_driver.execute_script.return_value = ["Job listings", False]
+
+    assert scraper.detect_blocking(mock_driver) is False
+    mock_driver.execute_script.assert_called_once()
+    mock_driver.find_elements.assert_not_called()
+
+    mock_driver.execute_script.return_value = ["Job listings", True]
+    assert scraper.detect_blocking(mock_driver) is True
+
+
+@patch("src.utils.browser_utils.random_delay")
+def test_human_like_hover_batch_uses_one_script_call(_mock_delay):
+    """Test that hovering over every card costs a single WebDriver call."""
+    driver = Mock()
+    cards = [Mock(spec=WebElement), Mock(spec=WebElement)]
+
+    scraper.human_like_hover_batch(driver, cards)
+    driver.execute_script.assert_called_once()
+    assert driver.execute_script.call_args.args[1] == cards
+
+    driver.reset_mock()
+    scraper.human_like_hover_batch(driver, [])
+    driver.execute_script.assert_not_called()
+
+
+def test_wait_for_visible_elements_returns_matched_cards():
+    """Test that the in-page wait hands back the cards instead of a bare flag."""
+    driver = Mock()
+    cards = [Mock(spec=WebElement), Mock(spec=WebElement)]
+    driver.execute_async_script.return_value = cards
+
+    assert scraper.wait_for_visible_elements(driver, "div.card", 5) == cards
+    driver.find_elements.assert_not_called()
+
+    driver.execute_async_script.return_value = None
+    with pytest.raises(TimeoutException):
+        scraper.wait_for_visible_elements(driver, "div.card", 5)
+
+
+@patch("src.scrapers.pagination.random_delay")
+def test_find_next_page_button_waits_for_old_cards_to_go_stale(mock_delay):
+    """Test that a page turn waits on the replaced cards instead of a fixed sleep."""
+    old_card = Mock(spec=WebElement)
+    old_card.is_enabled.side_effect = StaleElementReferenceException()
+    driver = Mock()
+    driver.execute_script.return_value = old_card
+
+    assert scraper._find_next_page_button(driver, "div.card") is True
+    driver.execute_script.assert_called_once()
+    mock_delay.assert_called_once_with(0.3, 0.7)
+
+    driver.execute_script.return_value = False
+    assert scraper._find_next_page_button(driver, "div.card") is False
+
+
+@patch("src.scrapers.pagination.random_delay")
+@patch("src.scrapers.pagination._find_next_page_button", return_value=True)
+@patch("src.scrapers.pagination._process_single_wuzzuf_page")
+def test_scrape_wuzzuf_pages_skips_repeated_jobs(mock_page, _mock_next, _mock_delay):
+    """Test that repeated links are dropped and a fully repeated page ends paging."""
+    job_a = {"title": "A", "link": "https://example.com/a"}
+    job_b = {"title": "B", "link": "https://example.com/b"}
+    driver = Mock()
+    mock_page.side_effect = [
+        ([job_a], True, driver),
+        ([job_a, job_b], True, driver),
+        ([job_b], True, driver),
+    ]
 
-def test_extract_date_not_found():
-    """Test extracting date when the element is not found (should default to 'Recently')."""
-    mock_card = Mock(spec=WebElement)
-    mock_card.find_element.side_effect = NoSuchElementException(
-        "Mock: Date element not found"
+    config = {"name": "Wuzzuf Test", "job_card_selector": "div.card"}
+    jobs = scraper._scrape_wuzzuf_pages(driver, config)
+
+    assert jobs == [job_a, job_b]
+    assert mock_page.call_count == 3
+
+
+@patch("src.scrapers.pagination.random_delay")
+@patch("src.scrapers.pagination._find_next_page_button", side_effect=[True, False])
+@patch("src.scrapers.pagination._process_single_wuzzuf_page")
+def test_scrape_wuzzuf_pages_continues_with_restarted_driver(
+    mock_page, mock_next, _mock_delay
+):
+    """Test that paging switches to the driver a page restarted after a block."""
+    old_driver, new_driver = Mock(), Mock()
+    mock_page.side_effect = [
+        ([{"title": "A", "link": "https://example.com/a"}], True, old_driver),
+        ([{"title": "B", "link": "https://example.com/b"}], True, new_driver),
+    ]
+
+    config = {"name": "Wuzzuf Test", "job_card_selector": "div.card"}
+    scraper._scrape_wuzzuf_pages(old_driver, config)
+
+    assert mock_page.call_args_list[1].args[0] is old_driver
+    assert mock_next.call_args_list[1].args[0] is new_driver
+
+
+@patch("src.scrapers.pagination._extract_all_cards_via_js", return_value=[])
+@patch("src.scrapers.pagination.random_delay")
+@patch("src.scrapers.pagination.wait_for_visible_elements", return_value=[])
+@patch("src.scrapers.pagination.human_like_hover_batch")
+@patch("src.scrapers.pagination.set_resource_blocking")
+@patch("src.scrapers.pagination.restart_driver_on_block")
+@patch("src.scrapers.pagination.detect_blocking", side_effect=[True, False])
+def test_process_single_wuzzuf_page_reloads_after_restart(
+    _mock_detect,
+    mock_restart,
+    mock_blocking,
+    _mock_hover,
+    mock_wait,
+    _mock_delay,
+    _mock_extract,
+):
+    """Test that a blocked page is reloaded on the restarted driver and scraped."""
+    old_driver, new_driver = Mock(), Mock()
+    mock_restart.return_value = new_driver
+    config = {
+        "name": "Wuzzuf Test",
+        "url": "https://wuzzuf.net/search/jobs/?q=it",
+        "job_card_selector": "div.card",
+        "title_selector": "h2",
+        "block_resources": False,
+    }
+
+    _, should_continue, driver = scraper._process_single_wuzzuf_page(
+        old_driver, config, 3
     )
 
-    date = _extract_date(mock_card, ".date", "Test Site")
-    assert date == "Recently"
-    mock_card.find_element.assert_called_once_with(By.CSS_SELECTOR, ".date")
+    assert should_continue is True
+    assert driver is new_driver
+    mock_restart.assert_called_once_with(old_driver)
+    mock_blocking.assert_called_once_with(new_driver, False)
+    new_driver.get.assert_called_once_with(
+        "https://wuzzuf.net/search/jobs/?q=it&start=2"
+    )
+    mock_wait.assert_called_once_with(new_driver, "div.card", 30)
+
+
+# --- Tests for the scraping retry loop ---
+
+
+@patch("src.scrapers.scraping_logic.random_delay")
+@patch("src.scrapers.scraping_logic.rotate_user_agent")
+@patch("src.scrapers.scraping_logic.set_resource_blocking")
+@patch("src.scrapers.scraping_logic.detect_blocking", return_value=True)
+@patch("src.utils.browser_utils.driver_pool")
+def test_persistent_blocking_restarts_driver(
+    mock_pool, _mock_detect, _mock_blocking, _mock_rotate, _mock_delay, monkeypatch
+):
+    """Test that a block surviving every navigation retry recycles the driver."""
+    # Only the restart matters here, so skip the jittered backoff sleeps
+    monkeypatch.setattr(scraper._safe_driver_get.retry, "wait", wait_none())
+    driver, new_driver = Mock(), Mock()
+    mock_pool.recycle.return_value = new_driver
+    website_config = {
+        "name": "Test Site",
+        "url": "https://example.com/jobs",
+        "job_card_selector": "div.card",
+    }
+
+    assert scraper._scrape_jobs_with_retry_logic(driver, website_config) == []
+    # One restart per outer attempt, each on the driver the previous one returned
+    assert mock_pool.recycle.call_count == 3
+    assert mock_pool.recycle.call_args_list[0].args == (driver, None)
+    mock_pool.recycle.assert_called_with(new_driver, None)
+
+
+@pytest.mark.parametrize(
+    ("error", "expected_jitter"),
+    [(WebDriverException("Connection reset"), True), (TimeoutException(), False)],
+)
+@patch("src.scrapers.scraping_logic.random_delay")
+@patch("src.scrapers.scraping_logic.rotate_user_agent")
+@patch("src.scrapers.scraping_logic.detect_blocking", return_value=False)
+def test_safe_driver_get_retries_first_failure_and_timeouts_immediately(
+    _mock_detect, _mock_rotate, _mock_delay, error, expected_jitter, monkeypatch
+):
+    """Test that only a repeated non-timeout failure waits before retrying."""
+    sleeps: list = []
+    monkeypatch.setattr(scraper._safe_driver_get.retry, "sleep", sleeps.append)
+    driver = Mock()
+    driver.get.side_effect = [error, error, None]
+
+    scraper._safe_driver_get(driver, "https://example.com/jobs")
+
+    assert driver.get.call_count == 3
+    assert sleeps[0] == 0
+    assert (0.5 <= sleeps[1] <= 2.0) if expected_jitter else sleeps[1] == 0
@@ -2,14 +2,24 @@ from unittest.mock import AsyncMock, mock_open, patch
 
 import pytest
 import telegram
+from tenacity import wait_none
 
+import main
 from src.utils.telegram_notifier import (
+    _escape_html,
     add_posted_job_link,
+    initialize_bot,
     load_posted_job_links,
     send_telegram_message,
 )
 
 
+@pytest.fixture
+def mock_bot():
+    """Returns a mocked Bot to pass to send_telegram_message."""
+    return AsyncMock()
+
+
 # Test load_posted_job_links
 def test_load_posted_job_links_existing_file():
     """Test loading links from an existing file."""
@@ -23,7 +33,7 @@ def test_load_posted_job_links_existing_file():
 
 def test_load_posted_job_links_non_existing_file():
     """Test loading links when file does not exist."""
-    with patch("os.path.exists", return_value=False):
+    with patch("builtins.open", side_effect=FileNotFoundError):
         links = load_posted_job_links("non_existent.txt")
         assert links == set()
 
@@ -48,14 +58,17 @@ def test_add_posted_job_link():
         handle.write.assert_called_once_with("new_link_4\n")
 
 
+def test_escape_html_only_rewrites_unsafe_text():
+    """Test that clean text is returned unchanged and unsafe text is escaped."""
+    clean = "Senior Python Developer"
+    assert _escape_html(clean) is clean
+    assert _escape_html("R&D <lead>") == "R&amp;D &lt;lead&gt;"
+
+
 # Test send_telegram_message (Requires async mocking)
 @pytest.mark.asyncio
-@patch("src.utils.telegram_notifier.telegram.Bot")
-async def test_send_telegram_message_success(mock_bot_class):
+async def test_send_telegram_message_success(mock_bot):
     """Test successful sending of a Telegram message."""
-    mock_bot_instance = AsyncMock()
-    mock_bot_class.return_value = mock_bot_instance
-
     job_post = {
         "title": "Test Job",
         "link": "http://test.com/job",
@@ -65,12 +78,11 @@ async def test_send_telegram_message_success(mock_bot_class):
         "posted_date": "2024-01-01",
     }
 
-    result = await send_telegram_message("fake_token", "fake_chat_id", job_post, False)
+    result = await send_telegram_message(mock_bot, "fake_chat_id", job_post, False)
 
     assert result is True
-    mock_bot_class.assert_called_once_with(token="fake_token")
-    mock_bot_instance.send_message.assert_called_once()
-    args, kwargs = mock_bot_instance.send_message.call_args
+    mock_bot.send_message.assert_called_once()
+    args, kwargs = mock_bot.send_message.call_args
     assert kwargs["chat_id"] == "fake_chat_id"
     assert "Test Job" in kwargs["text"]
     assert "This is a test description" in kwargs["text"]
@@ -79,12 +91,9 @@ async def test_send_telegram_message_success(mock_bot_class):
 
 
 @pytest.mark.asyncio
-@patch("src.utils.telegram_notifier.telegram.Bot")
-async def test_send_telegram_message_too_long(mock_bot_class):
+async def test_send_telegram_message_too_long(mock_bot):
     """Test handling of message too long error."""
-    mock_bot_instance = AsyncMock()
-    mock_bot_class.return_value = mock_bot_instance
-    mock_bot_instance.send_message.side_effect = telegram.error.TelegramError(
+    mock_bot.send_message.side_effect = telegram.error.TelegramError(
         "message is too long"
     )
 
@@ -97,22 +106,18 @@ async def test_send_telegram_message_too_long(mock_bot_class):
         "posted_date": "2024-01-01",
     }
 
-    result = await send_telegram_message("fake_token", "fake_chat_id", job_post, False)
+    result = await send_telegram_message(mock_bot, "fake_chat_id", job_post, False)
     assert result is False  # Should not retry, just fail
     # Ensure truncation logic was applied
-    args, kwargs = mock_bot_instance.send_message.call_args
+    args, kwargs = mock_bot.send_message.call_args
     assert "... (description truncated due to length limit)" in kwargs["text"]
+    assert len(kwargs["text"]) <= 4096
 
 
 @pytest.mark.asyncio
-@patch("src.utils.telegram_notifier.telegram.Bot")
-async def test_send_telegram_message_chat_not_found(mock_bot_class):
+async def test_send_telegram_message_chat_not_found(mock_bot):
     """Test handling of chat not found error (non-retriable)."""
-    mock_bot_instance = AsyncMock()
-    mock_bot_class.return_value = mock_bot_instance
-    mock_bot_instance.send_message.side_effect = telegram.error.TelegramError(
-        "chat not found"
-    )
+    mock_bot.send_message.side_effect = telegram.error.TelegramError("chat not found")
 
     job_post = {
         "title": "Error Job",
@@ -123,20 +128,17 @@ async def test_send_telegram_message_chat_not_found(mock_bot_class):
         "posted_date": "N/A",
     }
 
-    result = await send_telegram_message(
-        "fake_token", "invalid_chat_id", job_post, False
-    )
+    result = await send_telegram_message(mock_bot, "invalid_chat_id", job_post, False)
     assert result is False  # Should not retry, just fail
 
 
 @pytest.mark.asyncio
-@patch("src.utils.telegram_notifier.telegram.Bot")
-async def test_send_telegram_message_network_error_retries(mock_bot_class):
+async def test_send_telegram_message_network_error_retries(mock_bot, monkeypatch):
     """Test that transient network errors trigger retries."""
-    mock_bot_instance = AsyncMock()
-    mock_bot_class.return_value = mock_bot_instance
+    # Only the retry count matters here, so skip the jittered backoff sleeps
+    monkeypatch.setattr(send_telegram_message.retry, "wait", wait_none())
     # Simulate a transient network error on first two attempts, success on third
-    mock_bot_instance.send_message.side_effect = [
+    mock_bot.send_message.side_effect = [
         telegram.error.TelegramError("A timeout occurred"),
         telegram.error.TelegramError("Failed to connect to Telegram API"),
         None,  # Success on the third call
@@ -153,20 +155,14 @@ async def test_send_telegram_message_network_error_retries(mock_bot_class):
 
     # We expect send_telegram_message to return True after 3 attempts,
     # as tenacity will handle the retries within this call.
-    result = await send_telegram_message("fake_token", "fake_chat_id", job_post, False)
+    result = await send_telegram_message(mock_bot, "fake_chat_id", job_post, False)
     assert result is True
-    assert (
-        mock_bot_instance.send_message.call_count == 3
-    )  # Should have been called 3 times
+    assert mock_bot.send_message.call_count == 3  # Should have been called 3 times
 
 
 @pytest.mark.asyncio
-@patch("src.utils.telegram_notifier.telegram.Bot")
-async def test_send_telegram_message_with_date(mock_bot_class):
+async def test_send_telegram_message_with_date(mock_bot):
     """Test sending a Telegram message with date included."""
-    mock_bot_instance = AsyncMock()
-    mock_bot_class.return_value = mock_bot_instance
-
     job_post = {
         "title": "Test Job with Date",
         "link": "http://test.com/job",
@@ -176,12 +172,11 @@ async def test_send_telegram_message_with_date(mock_bot_class):
         "posted_date": "2024-01-01",
     }
 
-    result = await send_telegram_message("fake_token", "fake_chat_id", job_post, True)
+    result = await send_telegram_message(mock_bot, "fake_chat_id", job_post, True)
 
     assert result is True
-    mock_bot_class.assert_called_once_with(token="fake_token")
-    mock_bot_instance.send_message.assert_called_once()
-    args, kwargs = mock_bot_instance.send_message.call_args
+    mock_bot.send_message.assert_called_once()
+    args, kwargs = mock_bot.send_message.call_args
     assert kwargs["chat_id"] == "fake_chat_id"
     assert "Test Job with Date" in kwargs["text"]
     assert "<b>Posted:</b> 2024-01-01" in kwargs["text"]
@@ -189,12 +184,8 @@ async def test_send_telegram_message_with_date(mock_bot_class):
 
 
 @pytest.mark.asyncio
-@patch("src.utils.telegram_notifier.telegram.Bot")
-async def test_send_telegram_message_without_date(mock_bot_class):
+async def test_send_telegram_message_without_date(mock_bot):
     """Test sending a Telegram message without date included."""
-    mock_bot_instance = AsyncMock()
-    mock_bot_class.return_value = mock_bot_instance
-
     job_post = {
         "title": "Test Job without Date",
         "link": "http://test.com/job",
@@ -204,15 +195,42 @@ async def test_send_telegram_message_without_date(mock_bot_class):
         "posted_date": "2024-01-01",
     }
 
-    result = await send_telegram_message("fake_token", "fake_chat_id", job_post, False)
+    result = await send_telegram_message(mock_bot, "fake_chat_id", job_post, False)
 
     assert result is True
-    mock_bot_class.assert_called_once_with(token="fake_token")
-    mock_bot_instance.send_message.assert_called_once()
-    args, kwargs = mock_bot_instance.send_message.call_args
+    mock_bot.send_message.assert_called_once()
+    args, kwargs = mock_bot.send_message.call_args
     assert kwargs["chat_id"] == "fake_chat_id"
     assert "Test Job without Date" in kwargs["text"]
     assert (
         "<b>Posted:</b> 2024-01-01" not in kwargs["text"]
     )  # Date should not be included
     assert kwargs["parse_mode"] == telegram.constants.ParseMode.HTML
+
+
+@pytest.mark.asyncio
+async def test_initialize_bot_retries_transient_errors(mock_bot, monkeypatch):
+    """Test that a network blip during bot start-up is retried."""
+    monkeypatch.setattr(initialize_bot.retry, "wait", wait_none())
+    mock_bot.initialize.side_effect = [telegram.error.NetworkError("Timed out"), None]
+
+    await initialize_bot(mock_bot)
+
+    assert mock_bot.initialize.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_notify_new_jobs_returns_jobs_when_bot_cannot_start(
+    mock_bot, monkeypatch
+):
+    """Test that jobs are handed back unsent when the bot never starts."""
+    monkeypatch.setattr(initialize_bot.retry, "wait", wait_none())
+    monkeypatch.setitem(main.TELEGRAM_SETTINGS, "bot_token", "fake_token")
+    monkeypatch.setitem(main.TELEGRAM_SETTINGS, "chat_id", "fake_chat_id")
+    monkeypatch.setattr(main.telegram, "Bot", lambda token: mock_bot)
+    mock_bot.initialize.side_effect = telegram.error.NetworkError("Timed out")
+    new_jobs = [{"title": "Unsent Job", "link": "http://test.com/job"}]
+
+    assert await main.notify_new_jobs(new_jobs, "posted.txt") == new_jobs
+    assert mock_bot.initialize.call_count == 3
+    mock_bot.send_message.assert_not_called()